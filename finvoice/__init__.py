@@ -0,0 +1,5 @@
+# Voice-driven NSE stock prediction.
+# Heavy dependencies (TensorFlow, scikit-learn, speech and translation) are imported
+# lazily, so importing the package and the non-model helpers stays fast.
+from .companies import list_tickers, match_company_files
+from .predictor import last_close, predict, predict_many
@@ -0,0 +1,6 @@
+# python -m finvoice
+from .cli import main
+
+# Guarded so spawned training workers can import this module without re-running it
+if __name__ == "__main__":
+    main()
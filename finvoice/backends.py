@@ -0,0 +1,137 @@
+# Forecasting backends
+# Every backend builds a model with the same surface the registry and predictor use
+# (fit, save_weights, load_weights) and predicts a batch of windows in one call:
+#
+#   lstm   2 x LSTM(50) + Dense(horizon) in Keras (the original model)
+#   ridge  closed-form ridge regression on lagged returns, NumPy only; trains in
+#          milliseconds and never imports TensorFlow
+import os
+
+import numpy as np
+
+BACKEND = os.environ.get("FINVOICE_BACKEND", "lstm")
+RIDGE_LAGS = int(os.environ.get("FINVOICE_RIDGE_LAGS", 20))
+RIDGE_ALPHA = float(os.environ.get("FINVOICE_RIDGE_ALPHA", 1.0))
+
+
+# --- LSTM ---
+class LSTMBackend:
+    finetune = True  # Previous weights can be trained further on new rows
+    uses_tensorflow = True
+
+    def __init__(self):
+        self._prediction_fns = {}  # (window, n_features, horizon) -> traced batched forward pass
+
+    def build(self, window, n_features, horizon):
+        from tensorflow.keras.models import Sequential
+        from tensorflow.keras.layers import LSTM, Dense
+        from tensorflow.keras import Input
+        model = Sequential()
+        model.add(Input(shape=(window, n_features)))
+        model.add(LSTM(50, return_sequences=True))
+        model.add(LSTM(50))
+        model.add(Dense(horizon))
+        model.compile(optimizer='adam', loss='mean_squared_error')
+        return model
+
+    def _prediction_fn(self, window, n_features, horizon):
+        # One tf.function per architecture. The weights are inputs, stacked along a
+        # leading model axis, so any mix of models runs as one graph execution and a
+        # model reloaded from the registry doesn't trigger a new trace.
+        key = (window, n_features, horizon)
+        if key not in self._prediction_fns:
+            import tensorflow as tf
+            template = self.build(window, n_features, horizon)
+
+            def _one(args):
+                trainable, non_trainable, x = args
+                y, _ = template.stateless_call(list(trainable), list(non_trainable), x[None], training=False)
+                return y[0]
+
+            def _predict(trainable, non_trainable, X_batch):
+                return tf.map_fn(_one, (trainable, non_trainable, X_batch),
+                                 fn_output_signature=tf.TensorSpec((horizon,), tf.float32))
+
+            def stacked(variables):
+                return [tf.TensorSpec((None, *v.shape), v.dtype) for v in variables]
+            self._prediction_fns[key] = tf.function(_predict, input_signature=[
+                stacked(template.trainable_variables), stacked(template.non_trainable_variables),
+                tf.TensorSpec((None, window, n_features), tf.float32)])
+        return self._prediction_fns[key]
+
+    def predict(self, models, X_batch):
+        # Row i of X_batch goes through models[i], all in one graph execution
+        import tensorflow as tf
+        _, window, n_features = models[0].input_shape
+        fn = self._prediction_fn(window, n_features, models[0].output_shape[-1])
+        trainable = [tf.stack(weights) for weights in zip(*([v.value for v in m.trainable_variables] for m in models))]
+        non_trainable = [tf.stack(weights)
+                         for weights in zip(*([v.value for v in m.non_trainable_variables] for m in models))]
+        return fn(trainable, non_trainable, tf.convert_to_tensor(X_batch, tf.float32)).numpy()
+
+    def predict_windows(self, model, X):
+        # Many windows through one model, e.g. every day of a backtest
+        return model.predict(X, batch_size=256, verbose=0)
+
+
+# --- Ridge ---
+class RidgeForecaster:
+    # Predicts the next `horizon` scaled closes as the last scaled close plus a ridge
+    # regression on the last `lags` close changes and the latest row of every feature
+    def __init__(self, window, n_features, horizon, lags=RIDGE_LAGS, alpha=RIDGE_ALPHA):
+        self.lags = min(lags, window - 1)
+        self.alpha = alpha
+        self.coef = np.zeros((self.lags + n_features, horizon))
+        self.intercept = np.zeros(horizon)
+
+    def _design(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        return np.hstack([np.diff(X[:, -self.lags - 1:, 0], axis=1), X[:, -1, :]])
+
+    def fit(self, X, y, **kwargs):
+        # Keras-style arguments (epochs, batch_size, verbose) are accepted and ignored
+        A = self._design(X)
+        target = np.asarray(y, dtype=np.float64) - np.asarray(X[:, -1, :1], dtype=np.float64)
+        A_mean, target_mean = A.mean(axis=0), target.mean(axis=0)
+        A = A - A_mean
+        self.coef = np.linalg.solve(A.T @ A + self.alpha * np.eye(A.shape[1]), A.T @ (target - target_mean))
+        self.intercept = target_mean - A_mean @ self.coef
+        return self
+
+    def predict(self, X):
+        return np.asarray(X[:, -1, :1], dtype=np.float64) + self._design(X) @ self.coef + self.intercept
+
+    # Saved by the registry as <entry>.weights.npz
+    weights_suffix = ".weights.npz"
+
+    def save_weights(self, path):
+        with open(path, 'wb') as f:
+            np.savez(f, coef=self.coef, intercept=self.intercept, lags=self.lags)
+
+    def load_weights(self, path):
+        with np.load(path) as weights:
+            self.coef, self.intercept, self.lags = weights["coef"], weights["intercept"], int(weights["lags"])
+
+
+class RidgeBackend:
+    finetune = False  # Retraining from scratch is cheaper than any update
+    uses_tensorflow = False
+
+    def build(self, window, n_features, horizon):
+        return RidgeForecaster(window, n_features, horizon)
+
+    def predict(self, models, X_batch):
+        return np.concatenate([model.predict(X_batch[i:i + 1]) for i, model in enumerate(models)])
+
+    def predict_windows(self, model, X):
+        return model.predict(X)
+
+
+BACKENDS = {"lstm": LSTMBackend(), "ridge": RidgeBackend()}
+
+
+def get_backend(name=None):
+    name = name or BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"unknown model backend {name!r} (choose from {', '.join(BACKENDS)})")
+    return BACKENDS[name]
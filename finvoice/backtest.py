@@ -0,0 +1,145 @@
+# Walk-forward backtest of the investment tiers
+# Replays every day of each CSV: the model sees only rows up to that day, its
+# next-close prediction goes through investment_tier, and the suggested amount is
+# bought at that day's close and sold at the next. The model is retrained every
+# k days on the history available at that point. All windows come from one strided
+# view of the feature matrix, rescaled per retrain block, so each block is a
+# single batched prediction.
+#
+# Usage: python -m finvoice.backtest [TICKER ...] [--retrain-every 20] [--out backtest.json]
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .backends import BACKEND, get_backend
+from .companies import list_tickers, resolve
+from .predictor import (FEATURES, HORIZON, SUGGESTED_INVESTMENT, WINDOW, feature_matrix, inverse_close,
+                        investment_tier, train_model)
+from .price_store import load_prices
+
+RETRAIN_EVERY = int(os.environ.get("FINVOICE_RETRAIN_EVERY", 20))
+MIN_TRAIN = int(os.environ.get("FINVOICE_MIN_TRAIN", 120))  # Rows of history before the first trade day
+
+
+# --- Replay ---
+def walk_forward(df, retrain_every=RETRAIN_EVERY, min_train=MIN_TRAIN, window=WINDOW, horizon=HORIZON,
+                 features=FEATURES, backend=BACKEND):
+    # Returns (days, predicted next close) for every day t in [min_train, len(df) - 1),
+    # each prediction made from rows 0..t only
+    from sklearn.preprocessing import MinMaxScaler
+    raw = feature_matrix(df, features)
+    n_rows = len(raw)
+    if min_train < window + horizon or min_train >= n_rows - 1:
+        raise ValueError(f"need window + horizon <= min_train < {n_rows - 1} (got {min_train})")
+
+    # Window j covers rows j .. j + window - 1; targets j covers rows j .. j + horizon - 1
+    windows = sliding_window_view(raw, window, axis=0).transpose(0, 2, 1)
+    targets = sliding_window_view(raw[:, 0], horizon)
+
+    days = np.arange(min_train, n_rows - 1)
+    predicted = np.empty(len(days))
+    for start in range(0, len(days), retrain_every):
+        r = days[start]
+        block = days[start:start + retrain_every]
+        # Rows 0..r are known at r: fit the scaler there and train on every window
+        # whose targets all lie at or before r
+        scaler = MinMaxScaler().fit(raw[:r + 1])
+        n_train = r - window - horizon + 2
+        X = windows[:n_train] * scaler.scale_ + scaler.min_
+        y = targets[window:window + n_train] * scaler.scale_[0] + scaler.min_[0]
+        model = train_model(X, y, window, backend)
+
+        X_block = windows[block - window + 1] * scaler.scale_ + scaler.min_
+        scaled = get_backend(backend).predict_windows(model, X_block.astype(np.float32))
+        predicted[start:start + len(block)] = inverse_close(scaler, np.asarray(scaled)[:, 0])
+    return days, predicted
+
+
+# --- Scoring ---
+def score(df, days, predicted):
+    close = df['close'].values
+    today, tomorrow = close[days], close[days + 1]
+    change_percent = (predicted - today) / today * 100
+    tiers = np.vectorize(investment_tier, otypes=[object])(change_percent)
+    amount = np.vectorize(SUGGESTED_INVESTMENT.get, otypes=[float])(tiers)
+
+    pnl = amount * (tomorrow / today - 1)
+    equity = np.cumsum(pnl)
+    traded = amount > 0
+    return {
+        "days": int(len(days)),
+        "first_day": str(np.datetime64(df['date'].values[days[0]], 'D')),
+        "last_day": str(np.datetime64(df['date'].values[days[-1]], 'D')),
+        "trades": int(traded.sum()),
+        "pnl": round(float(pnl.sum()), 2),
+        "hit_rate": round(float((pnl[traded] > 0).mean()), 3) if traded.any() else None,
+        "direction_accuracy": round(float((np.sign(predicted - today) == np.sign(tomorrow - today)).mean()), 3),
+        "max_drawdown": round(float((np.maximum.accumulate(np.maximum(equity, 0)) - equity).max()), 2),
+        "tiers": {tier: {"days": int((tiers == tier).sum()), "pnl": round(float(pnl[tiers == tier].sum()), 2)}
+                  for tier in SUGGESTED_INVESTMENT},
+    }
+
+
+def backtest(ticker, retrain_every=RETRAIN_EVERY, min_train=MIN_TRAIN, backend=BACKEND):
+    company, filename = resolve(ticker)
+    df = load_prices(filename)
+    start = time.perf_counter()
+    days, predicted = walk_forward(df, retrain_every, min_train, backend=backend)
+    result = {"company": company, "backend": backend, "retrain_every": retrain_every}
+    result.update(score(df, days, predicted))
+    result["retrains"] = -(-len(days) // retrain_every)
+    result["elapsed_s"] = round(time.perf_counter() - start, 2)
+    return result
+
+
+# --- Scheduler ---
+def backtest_all(tickers, retrain_every=RETRAIN_EVERY, min_train=MIN_TRAIN, backend=BACKEND, workers=None):
+    # One ticker per worker process, like parallel_training; results in input order
+    from .parallel_training import TRAIN_WORKERS, _init_worker
+    workers = min(workers or TRAIN_WORKERS, len(tickers))
+    if workers <= 1 or not get_backend(backend).uses_tensorflow:
+        return [backtest(ticker, retrain_every, min_train, backend) for ticker in tickers]
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(max(1, (os.cpu_count() or 1) // workers), 1)) as pool:
+        n = len(tickers)
+        return list(pool.map(backtest, tickers, [retrain_every] * n, [min_train] * n, [backend] * n))
+
+
+# --- Main Execution ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="finvoice.backtest",
+                                     description="Walk-forward backtest of the investment tiers")
+    parser.add_argument("tickers", nargs="*", help="tickers to replay (default: all)")
+    parser.add_argument("--retrain-every", type=int, default=RETRAIN_EVERY, metavar="K",
+                        help="retrain the model every K trading days")
+    parser.add_argument("--min-train", type=int, default=MIN_TRAIN,
+                        help="rows of history before the first replayed day")
+    parser.add_argument("--backend", default=BACKEND, help="model backend (lstm, ridge)")
+    parser.add_argument("--workers", type=int, help="parallel ticker processes")
+    parser.add_argument("--out", help="also write the results here as JSON")
+    args = parser.parse_args(argv)
+
+    results = backtest_all(args.tickers or list_tickers(), args.retrain_every, args.min_train, args.backend,
+                           args.workers)
+    for r in results:
+        hit_rate = f"{r['hit_rate']:.0%}" if r['hit_rate'] is not None else "-"
+        print(f"- {r['company']}: {r['days']} days, {r['trades']} trades | P&L = ₹{r['pnl']:.2f} | "
+              f"Hit rate = {hit_rate} | Max drawdown = ₹{r['max_drawdown']:.2f} | "
+              f"Direction = {r['direction_accuracy']:.0%}")
+    print(f"🧾 Total P&L: ₹{sum(r['pnl'] for r in results):.2f}")
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+# Pipeline benchmarks: load -> window -> train -> predict
+# Runs offline (text query instead of the microphone) over the bundled CSVs and
+# synthetic NSE-format histories, and prints one JSON document so runs can be diffed.
+#
+# Usage: python -m finvoice.benchmark [--rows 10000 100000 1000000] [--out bench.json]
+#        python -m finvoice.benchmark --compare [lstm ridge]   (accuracy vs latency per backend)
+import argparse
+import contextlib
+import csv
+import glob
+import io
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from . import charts, model_registry, price_store
+
+NSE_HEADER = ["Date ", "series ", "OPEN ", "HIGH ", "LOW ", "PREV. CLOSE ", "ltp ", "close ",
+              "vwap ", "52W H ", "52W L ", "VOLUME ", "VALUE ", "No of trades "]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+MAX_SYNTHETIC_DAYS = 100_000  # Longer histories put several ticks on one date
+
+
+# --- Measurement ---
+def _rss_mb():
+    # ru_maxrss is the process high-water mark: KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure(results, dataset, rows, stage, fn, items=None, unit="rows/s", repeat=1):
+    # Runs fn `repeat` times and records the median wall time; returns fn's last result
+    rss_before = _rss_mb()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = fn()
+        timings.append(time.perf_counter() - start)
+    wall = statistics.median(timings)
+    results.append({
+        "dataset": dataset,
+        "rows": rows,
+        "stage": stage,
+        "wall_s": round(wall, 6),
+        "peak_rss_mb": round(_rss_mb(), 1),
+        "rss_growth_mb": round(_rss_mb() - rss_before, 1),
+        "throughput": round((items if items is not None else rows) / wall, 1) if wall > 0 else None,
+        "unit": unit,
+    })
+    print(f"  {dataset:>14} {stage:<14} {wall:9.4f}s", file=sys.stderr)
+    return value
+
+
+# --- Synthetic data ---
+def write_synthetic_csv(path, rows, seed=0):
+    # Geometric random walk in the NSE export layout: quoted headers with trailing
+    # spaces, dd-Mon-yyyy dates, comma thousands separators, newest row first
+    rng = np.random.default_rng(seed)
+    close = 1000 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    open_ = close * (1 + rng.normal(0, 0.003, rows))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.004, rows)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.004, rows)))
+    volume = rng.integers(100_000, 50_000_000, rows)
+    trades = rng.integers(1_000, 500_000, rows)
+    n_days = min(rows, MAX_SYNTHETIC_DAYS)
+    day = np.datetime64("2025-04-08") - (n_days - 1) + np.arange(rows) * n_days // rows
+    dates = np.datetime_as_string(day, unit="D")
+
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(NSE_HEADER)
+        for i in range(rows - 1, -1, -1):
+            y, m, d = dates[i].split("-")
+            prev = close[i - 1] if i else open_[i]
+            writer.writerow([
+                f"{d}-{MONTHS[int(m) - 1]}-{y}", "EQ", f"{open_[i]:.2f}", f"{high[i]:.2f}",
+                f"{low[i]:.2f}", f"{prev:.2f}", f"{close[i]:.2f}", f"{close[i]:.2f}",
+                f"{(high[i] + low[i] + close[i]) / 3:.2f}", f"{high.max():.2f}", f"{low.min():.2f}",
+                f"{volume[i]:,}", f"{volume[i] * close[i]:,.2f}", f"{trades[i]:,}",
+            ])
+
+
+# --- Stages ---
+def bench_dataset(results, filename, dataset, args):
+    from sklearn.preprocessing import MinMaxScaler
+    from .features import compute_features
+    from .predictor import FEATURES, HORIZON, WINDOW, build_model, feature_matrix, make_prediction, make_windows
+
+    with open(filename, encoding="utf-8-sig") as f:
+        rows = sum(1 for _ in f) - 1
+    measure(results, dataset, rows, "parse_csv", lambda: price_store.parse_csv(filename))
+    measure(results, dataset, rows, "ingest", lambda: price_store.ingest(filename))
+    df = measure(results, dataset, rows, "load_store", lambda: price_store.load_prices(filename),
+                 repeat=args.repeat)
+    measure(results, dataset, rows, "features", lambda: compute_features(df), repeat=args.repeat)
+
+    # The production model: every feature in FEATURES, a HORIZON-day forecast
+    scaler = MinMaxScaler()
+    scaled = measure(results, dataset, rows, "scale",
+                     lambda: scaler.fit_transform(feature_matrix(df, FEATURES)), repeat=args.repeat)
+    X, y = measure(results, dataset, rows, "window", lambda: make_windows(scaled, WINDOW, HORIZON),
+                   repeat=args.repeat)
+
+    # Training on a million windows isn't practical per run; the last train_limit
+    # windows are used and throughput is reported per window-epoch
+    X_train, y_train = X[-args.train_limit:], y[-args.train_limit:]
+    model = measure(results, dataset, rows, "build_model", lambda: build_model(WINDOW, len(FEATURES), HORIZON), items=1,
+                    unit="models/s")
+    measure(results, dataset, rows, "fit",
+            lambda: model.fit(X_train, y_train, epochs=args.epochs, batch_size=32, verbose=0),
+            items=len(X_train) * args.epochs, unit="window-epochs/s")
+
+    X_last = np.ascontiguousarray(X[-1:], dtype=np.float32)
+    measure(results, dataset, rows, "predict_first", lambda: make_prediction([model], X_last),
+            items=1, unit="predictions/s")
+    measure(results, dataset, rows, "predict", lambda: make_prediction([model], X_last),
+            items=1, unit="predictions/s", repeat=max(args.repeat, 10))
+
+
+def bench_voice_query(results, args):
+    # End-to-end CLI run with a text query standing in for get_voice_input();
+    # the first run trains into an empty registry, the second loads from it
+    from .cli import run_voice_query
+
+    query = args.query
+    for stage in ("query_cold", "query_warm"):
+        with contextlib.redirect_stdout(io.StringIO()):
+            measure(results, "voice_stub", None, stage, lambda: run_voice_query(query), items=1,
+                    unit="queries/s")
+
+
+# --- Backend comparison ---
+def compare_backends(results, filename, dataset, backends, args):
+    # Trains each backend on all but the last --holdout rows and scores its forecasts
+    # of the held-out rows, next to a "tomorrow = today" baseline
+    from sklearn.preprocessing import MinMaxScaler
+    from .predictor import (FEATURES, HORIZON, WINDOW, feature_matrix, inverse_close, make_prediction,
+                            make_windows, train_model)
+
+    df = price_store.load_prices(filename)
+    values = feature_matrix(df, FEATURES)
+    split = len(values) - args.holdout
+    scaler = MinMaxScaler().fit(values[:split])
+    X, y = make_windows(scaler.transform(values), WINDOW, HORIZON)
+    n_train = split - WINDOW - HORIZON + 1
+    X_test = np.ascontiguousarray(X[split - WINDOW:], dtype=np.float32)
+    actual = inverse_close(scaler, y[split - WINDOW:])
+    last = df['close'].values[split - 1:len(df) - HORIZON, np.newaxis]  # Last input close per test window
+    naive_mae = float(np.abs(actual - last).mean())
+
+    for backend in backends:
+        start = time.perf_counter()
+        model = train_model(X[:n_train], y[:n_train], WINDOW, backend)
+        train_s = time.perf_counter() - start
+
+        make_prediction([model], X_test[:1], backend)  # First call traces the graph
+        timings = []
+        for i in range(max(args.repeat, 10)):
+            start = time.perf_counter()
+            make_prediction([model], X_test[i % len(X_test):][:1], backend)
+            timings.append(time.perf_counter() - start)
+        predicted = inverse_close(scaler, np.concatenate(
+            [make_prediction([model], X_test[i:i + 1], backend) for i in range(len(X_test))]))
+
+        record = {
+            "dataset": dataset,
+            "rows": len(df),
+            "stage": "compare",
+            "backend": backend,
+            "train_s": round(train_s, 4),
+            "predict_ms": round(statistics.median(timings) * 1000, 3),
+            "mae": round(float(np.abs(predicted - actual).mean()), 4),
+            "mae_next": round(float(np.abs(predicted[:, 0] - actual[:, 0]).mean()), 4),
+            "naive_mae": round(naive_mae, 4),
+            "hit_rate": round(float((np.sign(predicted[:, 0] - last[:, 0]) == np.sign(actual[:, 0] - last[:, 0])).mean()), 3),
+            "test_windows": len(X_test),
+            "peak_rss_mb": round(_rss_mb(), 1),
+        }
+        results.append(record)
+        print(f"  {dataset:>14} {backend:<6} train {train_s:8.3f}s  predict {record['predict_ms']:8.3f}ms  "
+              f"mae {record['mae']:9.3f} (naive {record['naive_mae']:.3f})  hit {record['hit_rate']:.2f}",
+              file=sys.stderr)
+
+
+# --- Main Execution ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="finvoice.benchmark", description="Benchmark the load -> window -> train -> predict pipeline")
+    parser.add_argument("--csv", nargs="*", help="CSV files to benchmark (default: bundled *.csv)")
+    parser.add_argument("--rows", nargs="*", type=int, default=[10_000, 100_000, 1_000_000],
+                        help="synthetic history lengths")
+    parser.add_argument("--epochs", type=int, default=1)
+    parser.add_argument("--train-limit", type=int, default=5_000, help="max windows used for fit")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--query", default="compare hdfc tcs reliance infosys hindustan itc",
+                        help="text query for the end-to-end run")
+    parser.add_argument("--skip-query", action="store_true", help="skip the end-to-end CLI run")
+    parser.add_argument("--compare", nargs="*", metavar="BACKEND",
+                        help="compare model backends (default: all) on accuracy and latency instead")
+    parser.add_argument("--holdout", type=int, default=20, help="rows held out per CSV for --compare")
+    parser.add_argument("--out", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    csv_files = args.csv if args.csv is not None else sorted(glob.glob("*.csv"))
+    results = []
+    with tempfile.TemporaryDirectory(prefix="finvoice-bench-") as tmp:
+        # Keep benchmark artefacts out of the real store and model registry. Spawned
+        # training workers import these modules afresh, so they read the environment.
+        os.environ["FINVOICE_STORE_DIR"] = price_store.STORE_DIR = os.path.join(tmp, "store")
+        os.environ["FINVOICE_MODEL_DIR"] = model_registry.REGISTRY_DIR = os.path.join(tmp, "models")
+        os.environ["FINVOICE_CHART_DIR"] = charts.CHART_DIR = os.path.join(tmp, "charts")
+
+        if args.compare is not None:
+            from .backends import BACKENDS
+            for filename in csv_files:
+                compare_backends(results, filename, os.path.basename(filename), args.compare or list(BACKENDS), args)
+        else:
+            # Paid once per process; kept out of the first dataset's build_model time
+            measure(results, "startup", None, "import_tf", lambda: __import__("tensorflow"), items=1,
+                    unit="imports/s")
+            for filename in csv_files:
+                bench_dataset(results, filename, os.path.basename(filename), args)
+            for rows in args.rows:
+                path = os.path.join(tmp, f"SYNTH_{rows}.csv")
+                write_synthetic_csv(path, rows)
+                bench_dataset(results, path, f"synthetic_{rows}", args)
+            if not args.skip_query:
+                bench_voice_query(results, args)
+
+    tf = sys.modules.get("tensorflow")
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "numpy": np.__version__,
+            "tensorflow": tf.__version__ if tf else None,
+            "args": vars(args),
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Chart artifacts
+# Prediction charts are rendered on a background thread into PNG/SVG files keyed by
+# (ticker, CSV hash, forecast), so callers print their text without waiting and an
+# unchanged chart is served from disk instead of being drawn again. Rendering uses
+# matplotlib's Figure API with the Agg canvas: no pyplot state, no GUI windows, so it
+# works headless and from any thread.
+import glob
+import hashlib
+import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from . import metrics
+from .model_registry import data_hash, ticker_key
+
+CHART_DIR = os.environ.get("FINVOICE_CHART_DIR", "charts")
+CHART_FORMAT = os.environ.get("FINVOICE_CHART_FORMAT", "png")  # png or svg
+RECENT_DAYS = 50
+
+
+# --- Keys ---
+def chart_path(filename, forecast, fmt=CHART_FORMAT, digest=None):
+    prediction = hashlib.sha1(",".join(f"{price:.2f}" for price in forecast).encode()).hexdigest()[:10]
+    return os.path.join(CHART_DIR, f"{ticker_key(filename)}-{digest or data_hash(filename)}-{prediction}.{fmt}")
+
+
+# --- Rendering ---
+def render_chart(company_name, df, forecast, path):
+    # Recent closes and the forecast curve from the last close onwards
+    from matplotlib.figure import Figure
+    recent_prices = df['close'].values[-RECENT_DAYS:]
+    start = len(recent_prices) - 1
+
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
+    ax.plot(recent_prices, label=f"{company_name} Close", marker='o')
+    ax.plot(range(start, start + len(forecast) + 1), [recent_prices[-1], *forecast], label="Predicted",
+            marker='x', linestyle='--', color='red')
+    ax.set_title(f"{company_name} - Recent Trend & Prediction")
+    ax.set_xlabel("Days")
+    ax.set_ylabel("Price (₹)")
+    ax.legend()
+    ax.grid(True)
+    fig.tight_layout()
+
+    # Written under a temporary name so a reader never sees a half-written file
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    root, ext = os.path.splitext(path)
+    fig.savefig(root + ".tmp" + ext)
+    os.replace(root + ".tmp" + ext, path)
+    return path
+
+
+def _prune(filename, digest):
+    # Charts drawn from older versions of this CSV. Names must be exactly
+    # <ticker>-<digest>-<prediction>.<ext>, or BAJAJ would prune BAJAJ-AUTO's charts
+    pattern = re.compile(rf"{re.escape(ticker_key(filename))}-([0-9a-f]{{16}})-[0-9a-f]{{10}}\.")
+    for path in glob.glob(os.path.join(CHART_DIR, f"{glob.escape(ticker_key(filename))}-*")):
+        m = pattern.match(os.path.basename(path))
+        if m is not None and m.group(1) != digest:
+            os.remove(path)
+
+
+class ChartRenderer:
+    def __init__(self, fmt=CHART_FORMAT):
+        self.fmt = fmt
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="finvoice-charts")
+
+    def submit(self, company_name, filename, df, forecast):
+        # Future[path]; already resolved when the chart is cached
+        digest = data_hash(filename)
+        path = chart_path(filename, forecast, self.fmt, digest)
+        if os.path.exists(path):
+            metrics.count("cache", cache="chart", result="hit")
+            future = Future()
+            future.set_result(path)
+            return future
+        metrics.count("cache", cache="chart", result="miss")
+        forecast = [float(price) for price in forecast]
+        return self._executor.submit(self._render, company_name, filename, df, forecast, path, digest)
+
+    @staticmethod
+    def _render(company_name, filename, df, forecast, path, digest):
+        _prune(filename, digest)
+        with metrics.span("chart_render"):
+            return render_chart(company_name, df, forecast, path)
+
+    def close(self, wait=True):
+        self._executor.shutdown(wait=wait)
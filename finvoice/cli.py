@@ -0,0 +1,301 @@
+# Command-line entry point: the voice pipeline plus quick non-model commands.
+# Speech, translation, plotting and TensorFlow are imported only on the paths that
+# use them, so `tickers` and `last` start without loading any of them.
+import argparse
+import os
+import warnings
+from contextlib import contextmanager
+from . import metrics
+from .companies import list_tickers, match_company_files, resolve
+from .predictor import SUGGESTED_INVESTMENT, estimated_profit, investment_tier, last_close
+
+warnings.filterwarnings('ignore')
+os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
+
+# Global variables
+_translator = None
+_translation_cache = None
+selected_lang_name = ""
+target_lang_code = "en"  # Default fallback
+_report_lines = None  # Lines buffered by tprint inside report()
+DETAIL_LIMIT = int(os.environ.get("FINVOICE_DETAIL_LIMIT", 10))  # Larger matches print only the summary
+
+# --- Translator ---
+def get_translator():
+    global _translator
+    if _translator is None:
+        try:
+            from googletrans import Translator
+            _translator = Translator()
+        except ImportError:
+            # Offline install: static translations only, other lines stay in English
+            from .translation_cache import StubTranslator
+            _translator = StubTranslator()
+    return _translator
+
+def get_translation_cache():
+    global _translation_cache
+    if _translation_cache is None:
+        from .translation_cache import TranslationCache
+        _translation_cache = TranslationCache(get_translator())
+    return _translation_cache
+
+# --- Voice Input ---
+def get_voice_input(backend=None, audio_path=None, lang=None, on_partial=None):
+    # Returns the transcript in the spoken language. audio_path reads a WAV (or a
+    # .txt transcript) instead of the microphone; lang ("hi" or "2") skips the menu.
+    from .speech import LANGUAGES, get_backend
+    global selected_lang_name, target_lang_code
+
+    choice = next((key for key, (_, _, code) in LANGUAGES.items() if lang in (key, code)), None)
+    if lang is None:
+        print("\n🌐 Select a language for voice input:")
+        for key, (name, _, _) in LANGUAGES.items():
+            print(f"{key}. {name}")
+        choice = input("Enter your choice (e.g., 1 for English): ").strip()
+
+    if choice not in LANGUAGES:
+        print("⚠️ Invalid choice. Defaulting to English.")
+        choice = "1"
+        selected_lang_name, locale, target_lang_code = LANGUAGES[choice]
+    else:
+        selected_lang_name, locale, target_lang_code = LANGUAGES[choice]
+        print(f"✅ You selected: {selected_lang_name}")
+
+    if audio_path:
+        print(f"\n📂 Reading {audio_path} ({selected_lang_name})...")
+    else:
+        print(f"\n🎙 Speak now ({selected_lang_name})...")
+    try:
+        with metrics.span("voice_capture", lang=target_lang_code):
+            query = get_backend(backend, audio_path).transcribe(
+                locale, target_lang_code, audio_path, on_partial or (lambda text: None))
+        print(f"🗣 You said: {query}")
+        return query.lower()
+    except Exception as e:
+        print(f"⚠️ Error: {str(e)}")
+        return ""
+
+def match_query(query):
+    # The symbol table knows native-script names, so the translation round-trip is
+    # only needed when nothing matched in the spoken language
+    matched = match_company_files(query)
+    if matched or not query or target_lang_code == 'en':
+        return matched
+    try:
+        with metrics.span("query_translate", lang=target_lang_code):
+            translated = get_translator().translate(query, src=target_lang_code, dest='en')
+        print(f"🌐 Translated to English: {translated.text}")
+        return match_company_files(translated.text.lower())
+    except Exception as e:
+        print(f"⚠️ Error: {str(e)}")
+        return []
+
+# --- Translator print ---
+# tprint takes a template plus its values; the template is translated (cached) and
+# the values are formatted in afterwards
+def tprint(template, *args):
+    if _report_lines is not None:
+        _report_lines.append((template, args))
+    else:
+        _print_translated([(template, args)])
+
+def _print_translated(lines):
+    if target_lang_code == 'en':
+        for template, args in lines:
+            print(template.format(*args) if args else template)
+        return
+    with metrics.span("tprint_translate", lang=target_lang_code):
+        translated = get_translation_cache().translate([template for template, _ in lines], target_lang_code)
+    for text, (template, args) in zip(translated, lines):
+        try:
+            print(text.format(*args) if args else text)
+        except (IndexError, KeyError, ValueError):
+            print(template.format(*args))
+
+@contextmanager
+def report():
+    # Buffers tprint output so the whole block is translated in one batched call
+    global _report_lines
+    _report_lines = []
+    try:
+        yield
+    finally:
+        lines, _report_lines = _report_lines, None
+        _print_translated(lines)
+
+# --- Investment Suggestion ---
+def suggest_investment(last_close, predicted):
+    change_percent = ((predicted - last_close) / last_close) * 100
+    tier = investment_tier(change_percent)
+    tprint("\n💡 Investment Suggestion:")
+    if tier == "strong_buy":
+        tprint("🔼 Strong Buy: Predicted to rise by {:.2f}%", change_percent)
+        tprint("💰 Suggested Investment: ₹{}", "10,000")
+        tprint("📈 Estimated Profit: ₹{:.2f}", estimated_profit(last_close, predicted, SUGGESTED_INVESTMENT[tier]))
+        tprint("🟢 Risk Level: Low")
+    elif tier == "cautious_buy":
+        tprint("🟡 Cautious Buy: Small rise of {:.2f}%", change_percent)
+        tprint("💰 Suggested Investment: ₹{}", "5,000")
+        tprint("📈 Estimated Profit: ₹{:.2f}", estimated_profit(last_close, predicted, SUGGESTED_INVESTMENT[tier]))
+        tprint("🟡 Risk Level: Moderate")
+    elif tier == "hold":
+        tprint("⚖️ Hold: Almost no change ({:.2f}%)", change_percent)
+        tprint("🕒 Suggested Action: Wait and monitor trend.")
+        tprint("🟠 Risk Level: Medium")
+    else:
+        tprint("🔻 Fall Expected: Predicted drop of {:.2f}%", change_percent)
+        tprint("❌ Suggested Action: Avoid investing / Consider selling.")
+        tprint("🔴 Risk Level: High")
+
+# --- Voice Pipeline ---
+def run_voice_query(query=None, backend=None, audio_path=None, lang=None):
+    # query skips speech input, e.g. for `finvoice ask` and the benchmarks
+    from .speech import Prefetcher
+    prefetcher = None
+    try:
+        if query is None:
+            # Companies heard in partial transcripts start loading while the user speaks
+            prefetcher = Prefetcher()
+            query = get_voice_input(backend, audio_path, lang, prefetcher.on_partial)
+        with metrics.span("query"):
+            answer_query(match_query(query), prefetcher)
+    finally:
+        if prefetcher is not None:
+            prefetcher.close()
+
+def answer_query(matched_companies, prefetcher=None):
+    from .charts import ChartRenderer
+    from .companies import history_rows
+    from .parallel_training import train_all
+    from .predictor import MIN_ROWS, forecast_batch
+    from .price_store import iter_chunks
+
+    if matched_companies:
+        # New listings can't be modelled until they have MIN_ROWS days of history
+        short = [name for name, company_file in matched_companies if history_rows(name, company_file) < MIN_ROWS]
+        if short:
+            tprint("⚠️ Not enough price history yet for: {}", ", ".join(short))
+            matched_companies = [match for match in matched_companies if match[0] not in short]
+            if not matched_companies:
+                return
+
+        # Groups ("all banks", "top 50") stream through CHUNK_SIZE companies at a time;
+        # past DETAIL_LIMIT companies only the summary is printed
+        detailed = len(matched_companies) <= DETAIL_LIMIT
+        names = {company_file: company_name for company_name, company_file in matched_companies}
+        renderer = ChartRenderer()
+        charts = []
+        suggestions = []
+        for filenames, dfs in iter_chunks([company_file for _, company_file in matched_companies]):
+            if detailed:
+                for company_file in filenames:
+                    tprint("\n📄 Loading data for: {}", names[company_file])
+
+            # Models not prefetched during speech come from the registry; any missing
+            # there are trained concurrently, one process each
+            prefetched = {f: prefetcher.entry(f) for f in filenames} if prefetcher else {}
+            missing = [f for f in filenames if prefetched.get(f) is None]
+            trained = dict(zip(missing, train_all(missing)))
+            entries = [prefetched.get(f) or trained[f] for f in filenames]
+            models = [model for model, _ in entries]
+            scalers = [scaler for _, scaler in entries]
+
+            # One batched prediction for the chunk; each model returns its whole forecast
+            forecasts = forecast_batch(models, scalers, dfs)
+
+            for company_file, df, forecast in zip(filenames, dfs, forecasts):
+                company_name = names[company_file]
+                last_close = df['close'].values[-1]
+                predicted_price = forecast[0]
+                change_percent = ((predicted_price - last_close) / last_close) * 100
+
+                if detailed:
+                    # Charts are drawn to files in the background while the text is printed
+                    charts.append((company_name, renderer.submit(company_name, company_file, df, forecast)))
+                    # Each company's text goes out as one batched translation
+                    with report():
+                        tprint("\n📉 Last close for {0}: ₹{1:.2f}", company_name, last_close)
+                        tprint("📈 Predicted next for {0}: ₹{1:.2f}", company_name, predicted_price)
+                        if predicted_price > last_close:
+                            tprint("📊 {} likely to RISE 📈", company_name)
+                        else:
+                            tprint("📊 {} likely to FALL 📉", company_name)
+                        if len(forecast) > 1:
+                            tprint("📅 {0}-day forecast: {1}", len(forecast),
+                                   " → ".join(f"₹{price:.2f}" for price in forecast))
+                        suggest_investment(last_close, predicted_price)
+
+                suggestions.append({
+                    "company": company_name,
+                    "change_percent": change_percent,
+                    "last_close": last_close,
+                    "predicted": predicted_price
+                })
+
+        # Final Summary
+        with report():
+            tprint("\n🧾 Final Recommendation Summary:")
+            shown = suggestions if detailed else sorted(
+                suggestions, key=lambda x: x["change_percent"], reverse=True)[:DETAIL_LIMIT]
+            for s in shown:
+                tprint("- {0}: Change = {1:.2f}% | Last = ₹{2:.2f} | Predicted = ₹{3:.2f}",
+                       s['company'], s['change_percent'], s['last_close'], s['predicted'])
+            if len(suggestions) > len(shown):
+                tprint("…and {} more", len(suggestions) - len(shown))
+
+            best = max(suggestions, key=lambda x: x["change_percent"])
+            tprint("\n✅ Best Option: {0} (↑ {1:.2f}%)", best['company'], best['change_percent'])
+            if best["change_percent"] < 0:
+                tprint("⚠️ However, all options are predicted to fall. Caution advised.")
+
+        for company_name, chart in charts:
+            print(f"🖼 Chart for {company_name}: {chart.result()}")
+        renderer.close()
+    else:
+        tprint("❌ Could not find the company in your question. Try again with keywords like HDFC, ITC, etc.")
+
+# --- Main Execution ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="finvoice", description="Voice-driven NSE stock prediction")
+    commands = parser.add_subparsers(dest="command")
+    voice = commands.add_parser("voice", help="ask by voice (default)")
+    voice.add_argument("--backend", choices=["google", "vosk", "transcript"],
+                       help="speech recognizer (default: $FINVOICE_SPEECH_BACKEND or google)")
+    voice.add_argument("--input", help="WAV file (or .txt transcript) instead of the microphone")
+    voice.add_argument("--lang", help="language code or menu number, e.g. hi or 2")
+    ask = commands.add_parser("ask", help="ask in English text instead of by voice")
+    ask.add_argument("query", nargs="+")
+    commands.add_parser("tickers", help="list known tickers")
+    last = commands.add_parser("last", help="show the last close")
+    last.add_argument("tickers", nargs="+")
+    predict = commands.add_parser("predict", help="predict the next close")
+    predict.add_argument("tickers", nargs="+")
+    args = parser.parse_args(argv)
+
+    try:
+        run_command(args)
+    except KeyError as e:
+        print(f"❌ {e.args[0]}. Known tickers: {', '.join(list_tickers())}")
+
+def run_command(args):
+    if args.command == "tickers":
+        for ticker in list_tickers():
+            print(ticker)
+    elif args.command == "last":
+        for ticker in args.tickers:
+            print(f"📉 Last close for {resolve(ticker)[0]}: ₹{last_close(ticker):.2f}")
+    elif args.command == "predict":
+        from .predictor import predict_many
+        for result in predict_many(args.tickers):
+            print(f"- {result['company']}: Change = {result['change_percent']:.2f}% | "
+                  f"Last = ₹{result['last_close']:.2f} | Predicted = ₹{result['predicted']:.2f} | {result['tier']}")
+            if len(result['forecast']) > 1:
+                print(f"  {len(result['forecast'])}-day forecast: "
+                      + " → ".join(f"₹{price:.2f}" for price in result['forecast']))
+    elif args.command == "ask":
+        run_voice_query(" ".join(args.query).lower())
+    elif args.command == "voice":
+        run_voice_query(backend=args.backend, audio_path=args.input, lang=args.lang)
+    else:
+        run_voice_query()
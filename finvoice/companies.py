@@ -0,0 +1,134 @@
+# Company symbol table: NSE symbols, their export CSVs and spoken/typed aliases.
+# The table is data (symbols.json), not code, so adding a ticker or a language
+# needs no code change. Symbols found by the data directory index (symbol_index.py)
+# are added under their own name, so a new CSV needs no table entry either.
+import json
+import os
+import re
+from functools import lru_cache
+
+DATA_DIR = os.environ.get("FINVOICE_DATA_DIR", ".")
+SYMBOLS_PATH = os.environ.get(
+    "FINVOICE_SYMBOLS", os.path.join(os.path.dirname(os.path.abspath(__file__)), "symbols.json"))
+
+
+def load_table(path=SYMBOLS_PATH):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def load_symbols(path=SYMBOLS_PATH):
+    # symbols.json entries whose CSV is present, with index statistics (rows,
+    # turnover, ...), plus every indexed CSV the table doesn't name
+    from .symbol_index import index_path, load_index, refresh_index
+    table = load_table(path)
+    # Without an index every turnover is 0 and "top 5" can't be ranked, so the first
+    # run builds it; after that the nightly refresh keeps it current
+    index = load_index() if os.path.exists(index_path()) else refresh_index(symbols=table)
+    by_file = {os.path.normpath(rel): stats for rel, stats in index.items()}
+    entries = []
+    for entry in table:
+        stats = by_file.pop(os.path.normpath(entry["file"]), None)
+        if stats is not None:
+            entries.append(dict(stats, **entry))
+        elif os.path.exists(os.path.join(DATA_DIR, entry["file"])):
+            entries.append(entry)  # Added since the last index refresh
+    names = {entry["symbol"] for entry in entries}
+    for stats in by_file.values():
+        if stats["symbol"] not in names:
+            names.add(stats["symbol"])
+            entries.append(dict(stats, name=stats["symbol"], aliases={"en": [stats["symbol"].lower()]}))
+    return tuple(entries)
+
+
+@lru_cache(maxsize=None)
+def get_resolver(path=SYMBOLS_PATH):
+    from .resolver import CompanyResolver
+    return CompanyResolver(load_symbols(path))
+
+
+@lru_cache(maxsize=None)
+def _lookup(path=SYMBOLS_PATH):
+    # symbol, file stem and every alias -> entry
+    from .resolver import normalize
+    keys = {}
+    for entry in load_symbols(path):
+        names = [entry["symbol"], os.path.splitext(entry["file"])[0]]
+        names += [alias for aliases in entry["aliases"].values() for alias in aliases]
+        for name in names:
+            keys.setdefault(normalize(name), entry)
+    return keys
+
+
+@lru_cache(maxsize=None)
+def _by_symbol(path=SYMBOLS_PATH):
+    return {entry["symbol"]: entry for entry in load_symbols(path)}
+
+
+def list_tickers():
+    return [entry["symbol"] for entry in load_symbols()]
+
+
+def history_rows(symbol, filename):
+    # Rows of price history: from the symbol index while it is current for this
+    # CSV, else read off the price store
+    entry = _by_symbol().get(symbol, {})
+    if "rows" in entry and entry.get("mtime") == os.path.getmtime(filename):
+        return entry["rows"]
+    from .price_store import load_column
+    return len(load_column(filename, "close"))
+
+
+def resolve(ticker, allow_path=True):
+    # Accepts a symbol ("ITC"), a file stem ("HDFC_Bank"), any alias or, with
+    # allow_path, a CSV path. Returns (SYMBOL, csv_path).
+    from .resolver import normalize
+    entry = _lookup().get(normalize(os.path.splitext(os.path.basename(ticker))[0]))
+    if entry is not None:
+        return entry["symbol"], os.path.join(DATA_DIR, entry["file"])
+    if allow_path and ticker.endswith(".csv") and os.path.exists(ticker):
+        return os.path.splitext(os.path.basename(ticker))[0].upper(), ticker
+    raise KeyError(f"Unknown ticker: {ticker}")
+
+
+# --- Company Match ---
+# "all banks", "top 5 it stocks", "all the fmcg companies", "top 50"
+_GROUP = re.compile(r"\b(?:(?:all|every)|top\s+(\d+))(?:\s+(?:the|of|nse))*(?:\s+([a-z&]+))?")
+_GROUP_NOUNS = {"stock", "share", "company", "companie", "ticker", "symbol"}
+
+
+def _singular(word):
+    return word[:-1] if word.endswith("s") else word
+
+
+def match_group(query):
+    # Members of the group a query names, ranked by traded value from the symbol
+    # index: [(SYMBOL, csv_path), ...], or None when the query names no group
+    from .resolver import normalize
+    m = _GROUP.search(normalize(query))
+    if m is None:
+        return None
+    top, word = m.group(1), _singular(m.group(2) or "")
+    entries = load_symbols()
+    sectors = {entry["sector"] for entry in entries
+               if entry.get("sector") and _singular(entry["sector"].lower().split()[0]) == word}
+    if top is None and not sectors and word not in _GROUP_NOUNS:
+        return None  # "is it all going down?" names no group
+
+    selected = [entry for entry in entries if not sectors or entry.get("sector") in sectors]
+    selected.sort(key=lambda entry: entry.get("turnover", 0.0), reverse=True)
+    if top is not None:
+        selected = selected[:int(top)]
+    return [(entry["symbol"], os.path.join(DATA_DIR, entry["file"])) for entry in selected]
+
+
+def match_company_files(query):
+    # Companies mentioned in a free-text query, in any supported language,
+    # tolerating small misspellings, followed by the members of a named group.
+    # Returns [(SYMBOL, csv_path), ...].
+    entries = _by_symbol()
+    named = [(symbol, os.path.join(DATA_DIR, entries[symbol]["file"]))
+             for symbol in get_resolver().match(query)]
+    symbols = {symbol for symbol, _ in named}
+    return named + [(symbol, path) for symbol, path in match_group(query) or [] if symbol not in symbols]
@@ -0,0 +1,77 @@
+# Feature engine
+# Turns the parsed OHLC/VWAP/volume columns into model inputs. Every indicator is a
+# whole-array NumPy expression (cumulative sums for moving averages, one lfilter
+# pass for the exponential ones), so a full history is one pass per feature.
+# price_store writes the results next to the raw columns at ingest time.
+import numpy as np
+
+# Model input columns, in order; "close" must stay first (it is the target)
+FEATURES = [
+    "close", "return", "sma_10", "ema_20", "rsi_14", "atr_14", "vwap_dev", "log_volume", "range",
+]
+# Derived columns (everything but the raw close), as stored by price_store
+DERIVED = FEATURES[1:]
+
+
+# --- Indicators ---
+def sma(x, n):
+    # Simple moving average; the first n - 1 rows average what is available
+    total = np.concatenate([[0.0], np.cumsum(x)])
+    end = np.arange(1, len(x) + 1)
+    start = np.maximum(end - n, 0)
+    return (total[end] - total[start]) / (end - start)
+
+
+def ewm(x, alpha):
+    # y[t] = alpha * x[t] + (1 - alpha) * y[t - 1], seeded with x[0]
+    from scipy.signal import lfilter
+    if len(x) == 0:
+        return np.asarray(x, dtype=np.float64)
+    y, _ = lfilter([alpha], [1.0, alpha - 1.0], x, zi=[(1.0 - alpha) * x[0]])
+    return y
+
+
+def rsi(close, n=14):
+    # Wilder's RSI on a 0-1 scale (0.5 when there is no movement)
+    change = np.diff(close, prepend=close[:1])
+    gain = ewm(np.maximum(change, 0.0), 1.0 / n)
+    loss = ewm(np.maximum(-change, 0.0), 1.0 / n)
+    total = gain + loss
+    return np.divide(gain, total, out=np.full_like(total, 0.5), where=total > 0)
+
+
+def atr(high, low, close, n=14):
+    # Wilder's average true range
+    prev_close = np.concatenate([close[:1], close[:-1]])
+    true_range = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+    return ewm(true_range, 1.0 / n)
+
+
+# --- Feature table ---
+def _column(columns, name, fallback):
+    # Missing columns or unparsable cells fall back to a neutral value
+    if name not in columns:
+        return fallback
+    values = np.asarray(columns[name], dtype=np.float64)
+    return np.where(np.isnan(values), fallback, values)
+
+
+def compute_features(columns):
+    # columns: mapping of store column name -> array (a DataFrame works).
+    # Returns {feature name: float64 array} for every name in DERIVED.
+    close = np.asarray(columns["close"], dtype=np.float64)
+    high = _column(columns, "high", close)
+    low = _column(columns, "low", close)
+    vwap = _column(columns, "vwap", close)
+    volume = _column(columns, "volume", np.zeros_like(close))
+
+    return {
+        "return": np.diff(np.log(close), prepend=np.log(close[:1])),
+        "sma_10": close / sma(close, 10) - 1,
+        "ema_20": close / ewm(close, 2 / 21) - 1,
+        "rsi_14": rsi(close, 14),
+        "atr_14": atr(high, low, close, 14) / close,
+        "vwap_dev": close / vwap - 1,
+        "log_volume": np.log1p(volume),
+        "range": (high - low) / close,
+    }
@@ -0,0 +1,158 @@
+# Pipeline instrumentation
+# Span timers around each stage and counters for cache hits/misses and model
+# loads/retrains, sent to pluggable exporters. With no exporter configured, span()
+# returns one shared no-op context manager and count() returns at once, so the
+# instrumented code pays a single list check.
+#
+#   FINVOICE_METRICS=jsonl:metrics.jsonl        one JSON object per span / counter
+#   FINVOICE_METRICS=prometheus:finvoice.prom   text exposition written at exit
+#   FINVOICE_METRICS=jsonl,prometheus           both (defaults: metrics.jsonl, no file)
+#
+# The HTTP server serves the Prometheus exporter at GET /metrics.
+import atexit
+import contextlib
+import json
+import os
+import threading
+import time
+
+_exporters = []
+_NULL_SPAN = contextlib.nullcontext()
+
+# Upper bounds (seconds) of the Prometheus latency histogram buckets
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+
+
+# --- Instrumentation API ---
+class _Span:
+    __slots__ = ("name", "labels", "start")
+
+    def __init__(self, name, labels):
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.start
+        for exporter in _exporters:
+            exporter.span(self.name, seconds, self.labels)
+
+
+def span(name, **labels):
+    # with span("fit", backend="lstm"): ...
+    if not _exporters:
+        return _NULL_SPAN
+    return _Span(name, labels)
+
+
+def count(name, value=1, **labels):
+    # count("cache", cache="price_store", result="hit")
+    if not _exporters:
+        return
+    for exporter in _exporters:
+        exporter.count(name, value, labels)
+
+
+def add_exporter(exporter):
+    _exporters.append(exporter)
+    return exporter
+
+
+def get_exporter(kind):
+    return next((exporter for exporter in _exporters if isinstance(exporter, kind)), None)
+
+
+# --- Exporters ---
+class JsonLinesExporter:
+    def __init__(self, path="metrics.jsonl"):
+        self._file = open(path, "a", buffering=1, encoding="utf-8")
+        self._lock = threading.Lock()
+        atexit.register(self._file.close)
+
+    def _write(self, record):
+        record.update(ts=round(time.time(), 6), pid=os.getpid())
+        line = json.dumps(record)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def span(self, name, seconds, labels):
+        self._write({"type": "span", "name": name, "seconds": round(seconds, 6), "labels": labels})
+
+    def count(self, name, value, labels):
+        self._write({"type": "counter", "name": name, "value": value, "labels": labels})
+
+
+class PrometheusExporter:
+    # Aggregates in memory; render() returns the text exposition format
+    def __init__(self, path=None):
+        self._lock = threading.Lock()
+        self._counters = {}  # (name, labels) -> value
+        self._spans = {}     # labels incl. stage -> [bucket counts..., count, sum]
+        if path:
+            atexit.register(self.write, path)
+
+    def span(self, name, seconds, labels):
+        key = tuple(sorted({**labels, "stage": name}.items()))
+        with self._lock:
+            stats = self._spans.setdefault(key, [0] * (len(BUCKETS) + 2))
+            for i, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    stats[i] += 1
+            stats[-2] += 1
+            stats[-1] += seconds
+
+    def count(self, name, value, labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def render(self):
+        lines = []
+        with self._lock:
+            for name in sorted({name for name, _ in self._counters}):
+                lines.append(f"# TYPE finvoice_{name}_total counter")
+                for (counter, labels), value in sorted(self._counters.items()):
+                    if counter == name:
+                        lines.append(f"finvoice_{name}_total{_labels(labels)} {value}")
+            if self._spans:
+                lines.append("# TYPE finvoice_stage_seconds histogram")
+            for labels, stats in sorted(self._spans.items()):
+                for bound, n in zip(BUCKETS, stats):
+                    lines.append(f"finvoice_stage_seconds_bucket{_labels(labels + (('le', str(bound)),))} {n}")
+                lines.append(f"finvoice_stage_seconds_bucket{_labels(labels + (('le', '+Inf'),))} {stats[-2]}")
+                lines.append(f"finvoice_stage_seconds_count{_labels(labels)} {stats[-2]}")
+                lines.append(f"finvoice_stage_seconds_sum{_labels(labels)} {stats[-1]:.6f}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        with open(path + ".tmp", "w") as f:
+            f.write(self.render())
+        os.replace(path + ".tmp", path)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(items):
+    if not items:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in items) + "}"
+
+
+EXPORTERS = {"jsonl": JsonLinesExporter, "prometheus": PrometheusExporter}
+
+
+def configure(spec):
+    # "kind[:path],..." as in FINVOICE_METRICS
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        kind, _, path = item.partition(":")
+        if kind not in EXPORTERS:
+            raise ValueError(f"unknown metrics exporter {kind!r} (choose from {', '.join(EXPORTERS)})")
+        add_exporter(EXPORTERS[kind](path) if path else EXPORTERS[kind]())
+
+
+configure(os.environ.get("FINVOICE_METRICS", ""))
@@ -0,0 +1,138 @@
+# Persistent model registry
+# Trained weights and the fitted MinMaxScaler are stored per ticker CSV, keyed
+# by a hash of the file contents, so a query only retrains when the CSV changes.
+import glob
+import hashlib
+import json
+import os
+import pickle
+import re
+
+from . import metrics
+
+REGISTRY_DIR = os.environ.get("FINVOICE_MODEL_DIR", "models")
+
+
+# --- Keys ---
+def data_hash(filename):
+    h = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()[:16]
+
+
+def ticker_key(filename):
+    return os.path.splitext(os.path.basename(filename))[0]
+
+
+def entry_digest(filename, tag=""):
+    # tag distinguishes model variants (e.g. window length) trained on the same CSV
+    return data_hash(filename) + (f"-{tag}" if tag else "")
+
+
+def _entry_prefix(filename, digest):
+    return os.path.join(REGISTRY_DIR, f"{ticker_key(filename)}-{digest}")
+
+
+def _entry_files(filename, suffix=""):
+    # (path, data hash, tag) for this ticker's registry files. The file name must be
+    # exactly <ticker>-<16 hex>[-<tag>].<suffix>: a bare prefix glob would also
+    # match other tickers that start with this one (BAJAJ and BAJAJ-AUTO)
+    pattern = re.compile(rf"{re.escape(ticker_key(filename))}-([0-9a-f]{{16}})(?:-([^.]+))?\.")
+    for path in glob.glob(os.path.join(REGISTRY_DIR, f"{glob.escape(ticker_key(filename))}-*{suffix}")):
+        m = pattern.match(os.path.basename(path))
+        if m is not None:
+            yield path, m.group(1), m.group(2) or ""
+
+
+# --- Load / Save ---
+def _weights_path(prefix, model):
+    # Each model type names its weights format; Keras models save HDF5
+    return prefix + getattr(model, "weights_suffix", ".weights.h5")
+
+
+def _load(prefix, build_model):
+    # (model, scaler), or None when the weights for this model type are missing
+    model = build_model()
+    if not os.path.exists(_weights_path(prefix, model)):
+        return None
+    model.load_weights(_weights_path(prefix, model))
+    with open(prefix + ".scaler.pkl", 'rb') as f:
+        scaler = pickle.load(f)
+    return model, scaler
+
+
+def load_entry(filename, build_model, digest=None):
+    prefix = _entry_prefix(filename, digest or data_hash(filename))
+    if not os.path.exists(prefix + ".scaler.pkl"):
+        return None
+    return _load(prefix, build_model)
+
+
+def load_latest_entry(filename, build_model, tag=""):
+    # The newest entry for this ticker and tag, whatever CSV version it was trained on.
+    # Returns (model, scaler, meta) or None.
+    candidates = [path[:-len(".scaler.pkl")] for path, _, entry_tag in _entry_files(filename, ".scaler.pkl")
+                  if entry_tag == tag]
+    for prefix in sorted(candidates, key=lambda p: os.path.getmtime(p + ".scaler.pkl"), reverse=True):
+        entry = _load(prefix, build_model)
+        if entry is None:
+            continue
+        meta = {}
+        if os.path.exists(prefix + ".meta.json"):
+            with open(prefix + ".meta.json") as f:
+                meta = json.load(f)
+        return (*entry, meta)
+    return None
+
+
+def save_entry(filename, model, scaler, digest=None, meta=None):
+    digest = digest or data_hash(filename)
+    os.makedirs(REGISTRY_DIR, exist_ok=True)
+    prefix = _entry_prefix(filename, digest)
+
+    # Write to temp names first so a crash never leaves a half-written entry
+    weights_path = _weights_path(prefix, model)
+    model.save_weights(_weights_path(prefix + ".tmp", model))
+    with open(prefix + ".scaler.pkl.tmp", 'wb') as f:
+        pickle.dump(scaler, f)
+    with open(prefix + ".meta.json.tmp", 'w') as f:
+        json.dump(meta or {}, f)
+    os.replace(_weights_path(prefix + ".tmp", model), weights_path)
+    # Weights this entry left in another format, e.g. ridge entries from before each
+    # backend named its own
+    for path in glob.glob(glob.escape(prefix) + ".weights.*"):
+        if path != weights_path:
+            os.remove(path)
+    os.replace(prefix + ".meta.json.tmp", prefix + ".meta.json")
+    os.replace(prefix + ".scaler.pkl.tmp", prefix + ".scaler.pkl")
+
+    # Drop entries of the same variant trained on older versions of this CSV;
+    # other tags (window lengths, feature sets) are kept
+    current, _, tag = digest.partition("-")
+    for path, other, entry_tag in _entry_files(filename):
+        if other != current and entry_tag == tag:
+            os.remove(path)
+
+
+def get_or_train(filename, build_model, train, tag="", update=None, meta=None):
+    # Returns (model, scaler, trained) where trained is False on a registry hit.
+    # When the CSV changed and update is given, update(model, scaler, meta) warm-starts
+    # from the previous entry; returning None from it falls back to train().
+    digest = entry_digest(filename, tag)
+    entry = load_entry(filename, build_model, digest)
+    if entry is not None:
+        model, scaler = entry
+        metrics.count("model", outcome="load")
+        return model, scaler, False
+
+    updated = None
+    if update is not None:
+        previous = load_latest_entry(filename, build_model, tag)
+        if previous is not None:
+            updated = update(*previous)
+    metrics.count("model", outcome="retrain" if updated is None else "update")
+    model, scaler = updated if updated is not None else train()
+    save_entry(filename, model, scaler, digest, meta)
+    return model, scaler, True
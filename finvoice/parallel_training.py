@@ -0,0 +1,93 @@
+# Parallel training scheduler
+# Tickers missing from the model registry are trained in a process pool, one
+# ticker per worker, with TensorFlow thread pools capped so workers don't
+# oversubscribe the CPU. Workers save to the registry; the parent loads from it.
+#
+# Nightly refresh: python -m finvoice.parallel_training [CSV ...]  (defaults to every
+# CSV in the symbol index)
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from . import metrics
+from .backends import get_backend
+from .model_registry import REGISTRY_DIR, entry_digest, load_entry
+from .predictor import FEATURES, HORIZON, WINDOW, build_model, get_model, registry_tag
+
+TRAIN_WORKERS = int(os.environ.get("FINVOICE_TRAIN_WORKERS", os.cpu_count() or 1))
+
+
+# --- Worker ---
+def _init_worker(intra_op_threads, inter_op_threads):
+    import tensorflow as tf
+    tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+    tf.config.threading.set_inter_op_parallelism_threads(inter_op_threads)
+
+
+def _train_worker(filename, window):
+    get_model(filename, window)
+    return filename
+
+
+# --- Scheduler ---
+def train_all(filenames, window=None, workers=None, intra_op_threads=None, inter_op_threads=1):
+    # Returns [(model, scaler), ...] in the same order as filenames
+    window = window or WINDOW
+    tag = registry_tag(window)
+
+    entries = {}
+    missing = []
+    for filename in dict.fromkeys(filenames):
+        entry = load_entry(filename, lambda: build_model(window, len(FEATURES), HORIZON), entry_digest(filename, tag))
+        if entry is None:
+            missing.append(filename)
+        else:
+            metrics.count("model", outcome="load")
+            entries[filename] = entry
+
+    workers = min(workers or TRAIN_WORKERS, len(missing))
+    if not get_backend().uses_tensorflow:
+        workers = 1  # Trains in milliseconds; a worker process would cost more than it saves
+    if workers > 1:
+        intra_op_threads = intra_op_threads or max(1, (os.cpu_count() or 1) // workers)
+        # spawn, not fork: TensorFlow is not fork-safe once initialised
+        with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(intra_op_threads, inter_op_threads)) as pool:
+            list(pool.map(_train_worker, missing, [window] * len(missing)))
+        for filename in missing:
+            entries[filename] = load_entry(filename, lambda: build_model(window, len(FEATURES), HORIZON), entry_digest(filename, tag))
+            if entries[filename] is None:
+                # The worker saved somewhere else, e.g. a registry directory set only in this process
+                raise RuntimeError(f"trained model for {filename} not found in the registry "
+                                   "(set FINVOICE_MODEL_DIR so worker processes see the same registry)")
+    else:
+        # A single ticker isn't worth a worker process start-up
+        for filename in missing:
+            entries[filename] = get_model(filename, window)
+
+    return [entries[filename] for filename in filenames]
+
+
+if __name__ == "__main__":
+    if sys.argv[1:]:
+        csv_files = sys.argv[1:]
+    else:
+        # Every CSV in the symbol index, refreshed first so new listings are picked up;
+        # listings with less than MIN_ROWS days of history wait for more
+        from .companies import DATA_DIR
+        from .predictor import MIN_ROWS
+        from .symbol_index import refresh_index
+        index = refresh_index()
+        short = [entry["symbol"] for entry in index.values() if entry["rows"] < MIN_ROWS]
+        if short:
+            print(f"⚠️ Not enough history to train: {', '.join(short)}")
+        csv_files = [os.path.join(DATA_DIR, rel) for rel, entry in index.items() if entry["rows"] >= MIN_ROWS]
+    # A chunk at a time, so the parent never holds every loaded model at once
+    from .price_store import CHUNK_SIZE
+    for start in range(0, len(csv_files), CHUNK_SIZE):
+        train_all(csv_files[start:start + CHUNK_SIZE])
+    print(f"✅ Refreshed {len(csv_files)} models in {REGISTRY_DIR}")
@@ -0,0 +1,188 @@
+# Prediction engine shared by the CLI, the Streamlit app and the training workers.
+# TensorFlow and scikit-learn are imported inside the functions that use them, so
+# importing this module (e.g. for investment_tier) doesn't pay their start-up cost.
+import hashlib
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+import os
+from . import metrics
+from .backends import BACKEND, get_backend
+from .companies import resolve
+from . import features as feature_engine
+from .model_registry import get_or_train
+from .price_store import iter_chunks, load_column, load_prices
+
+os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
+
+WINDOW = int(os.environ.get("FINVOICE_WINDOW", 60))  # Days of history per sample
+HORIZON = int(os.environ.get("FINVOICE_HORIZON", 5))  # Trading days forecast per prediction
+MIN_ROWS = WINDOW + HORIZON  # Shortest history that yields a training window
+FINETUNE_EPOCHS = int(os.environ.get("FINVOICE_FINETUNE_EPOCHS", 3))
+# Model inputs, comma-separated names from features.FEATURES; "close" alone gives
+# the original univariate model
+FEATURES = os.environ.get("FINVOICE_FEATURES", ",".join(feature_engine.FEATURES)).split(",")
+
+# --- Data Preprocessing ---
+def feature_matrix(df, features=FEATURES):
+    # (rows, n_features) float64; df comes from load_prices, which carries the cached features
+    return np.column_stack([df[name].values for name in features])
+
+def load_and_prepare_data(filename, window=WINDOW, features=FEATURES, horizon=HORIZON):
+    # Parsed columns and features come from the binary store; the CSV is only re-read when newer
+    from sklearn.preprocessing import MinMaxScaler
+    df = load_prices(filename)
+
+    scaler = MinMaxScaler()
+    with metrics.span("scale"):
+        scaled_data = scaler.fit_transform(feature_matrix(df, features))
+
+    with metrics.span("window"):
+        X, y = make_windows(scaled_data, window, horizon)
+    return X, y, scaler, df
+
+def make_windows(scaled_data, window=WINDOW, horizon=1):
+    # Strided (N - window - horizon + 1, window, n_features) view over scaled_data,
+    # no per-window copies; the target is the next `horizon` values of column 0 (close)
+    X = sliding_window_view(scaled_data[:len(scaled_data) - horizon], window, axis=0).transpose(0, 2, 1)
+    y = sliding_window_view(scaled_data[window:, 0], horizon)
+    return X, y
+
+def inverse_close(scaler, scaled_close):
+    # Undo the MinMaxScaler for the close column only
+    return (np.asarray(scaled_close) - scaler.min_[0]) / scaler.scale_[0]
+
+# --- Model ---
+def build_model(window=WINDOW, n_features=1, horizon=1, backend=BACKEND):
+    # One output per forecast day, so the whole curve comes from a single forward pass
+    return get_backend(backend).build(window, n_features, horizon)
+
+def train_model(X, y, window=WINDOW, backend=BACKEND):
+    model = build_model(window, X.shape[-1], y.shape[-1], backend)
+    with metrics.span("fit", backend=backend):
+        model.fit(X, y, epochs=20, batch_size=32, verbose=0)
+    return model
+
+# --- Registry ---
+def registry_tag(window=WINDOW, features=FEATURES, horizon=HORIZON, backend=BACKEND):
+    # Univariate next-day LSTM entries keep their original tag
+    tag = f"w{window}"
+    if list(features) != ["close"]:
+        tag += f"-f{len(features)}-" + hashlib.sha1(",".join(features).encode()).hexdigest()[:8]
+    if horizon > 1:
+        tag += f"-h{horizon}"
+    if backend != "lstm":
+        tag += f"-{backend}"
+    return tag
+
+def train_entry(filename, window=WINDOW, features=FEATURES, horizon=HORIZON, backend=BACKEND):
+    X, y, scaler, _ = load_and_prepare_data(filename, window, features, horizon)
+    return train_model(X, y, window, backend), scaler
+
+def entry_meta(df):
+    return {"last_date": str(np.datetime64(df['date'].values[-1], 'D')), "rows": len(df)}
+
+def update_model(model, scaler, df, meta, window=WINDOW, epochs=FINETUNE_EPOCHS, features=FEATURES,
+                 horizon=HORIZON, backend=BACKEND):
+    # Fine-tune the previous model on the windows whose targets are rows added since
+    # it was trained. Returns None when a full retrain is needed instead.
+    from sklearn.preprocessing import MinMaxScaler
+    if "last_date" not in meta or not get_backend(backend).finetune:
+        return None
+    n_new = int((df['date'].values > np.datetime64(meta["last_date"])).sum())
+    if n_new == 0 or n_new >= len(df) - window - horizon + 1:
+        return None
+
+    values = feature_matrix(df, features)
+    new_values = values[-n_new:]
+    # The first window with a new row among its targets
+    first = max(len(df) - n_new - window - horizon + 1, 0)
+    # Keep the fitted scaler unless new rows fall outside its range; a refit
+    # rescales the whole history, so then every window is replayed
+    if (new_values.min(axis=0) < scaler.data_min_).any() or (new_values.max(axis=0) > scaler.data_max_).any():
+        scaler = MinMaxScaler().fit(values)
+        first = 0
+
+    X, y = make_windows(scaler.transform(values), window, horizon)
+    with metrics.span("finetune", backend=backend):
+        model.fit(X[first:], y[first:], epochs=epochs, batch_size=32, verbose=0)
+    return model, scaler
+
+def get_model(filename, window=WINDOW, features=FEATURES, horizon=HORIZON, backend=BACKEND):
+    # Reuse the saved model unless the CSV changed since it was trained; if it did,
+    # warm-start from the previous model instead of training from scratch
+    df = load_prices(filename)
+    model, scaler, _ = get_or_train(
+        filename, lambda: build_model(window, len(features), horizon, backend),
+        lambda: train_entry(filename, window, features, horizon, backend),
+        tag=registry_tag(window, features, horizon, backend),
+        update=lambda model, scaler, meta: update_model(model, scaler, df, meta, window, features=features,
+                                                        horizon=horizon, backend=backend),
+        meta=entry_meta(df))
+    return model, scaler
+
+# --- Batched prediction ---
+def make_prediction(models, X_batch, backend=BACKEND):
+    # Row i of X_batch goes through models[i], in one call to the backend; returns a NumPy array
+    with metrics.span("predict", backend=backend):
+        return get_backend(backend).predict(models, X_batch)
+
+def forecast_batch(models, scalers, dfs, window=WINDOW, features=FEATURES, backend=BACKEND):
+    # One price curve per company (the model's horizon, in days), all from one batched call
+    X_batch = np.stack([
+        scaler.transform(feature_matrix(df.iloc[-window:], features))
+        for scaler, df in zip(scalers, dfs)
+    ]).astype(np.float32)
+    scaled = make_prediction(list(models), X_batch, backend)
+    return [inverse_close(scaler, scaled[i]) for i, scaler in enumerate(scalers)]
+
+# --- Investment tiers ---
+# Keys match the tier names in translations.py; values are the suggested amount (₹)
+SUGGESTED_INVESTMENT = {"strong_buy": 10000, "cautious_buy": 5000, "hold": 0, "fall_expected": 0}
+
+def investment_tier(change_percent):
+    if change_percent > 2:
+        return "strong_buy"
+    elif 0.5 < change_percent <= 2:
+        return "cautious_buy"
+    elif -0.5 <= change_percent <= 0.5:
+        return "hold"
+    return "fall_expected"
+
+def estimated_profit(last_close, predicted, amount):
+    return (predicted - last_close) * (amount / last_close)
+
+# --- Public API ---
+def predict_many(tickers, window=WINDOW):
+    # Returns one result dict per ticker, in order, from one batched prediction per
+    # chunk of CHUNK_SIZE tickers; only the small result dicts outlive their chunk
+    from .parallel_training import train_all
+    companies = [resolve(ticker) for ticker in tickers]
+    names = {filename: company for company, filename in companies}
+    results = []
+    for filenames, dfs in iter_chunks([filename for _, filename in companies]):
+        entries = train_all(filenames, window)
+        forecasts = forecast_batch([m for m, _ in entries], [s for _, s in entries], dfs, window)
+        results.extend(prediction_result(names[filename], df, forecast)
+                       for filename, df, forecast in zip(filenames, dfs, forecasts))
+    return results
+
+def prediction_result(company, df, forecast):
+    # The fields the CLI prints for one company; tiers follow the next close
+    forecast = np.atleast_1d(forecast)
+    last_close = float(df['close'].values[-1])
+    change_percent = (float(forecast[0]) - last_close) / last_close * 100
+    return {
+        "company": company,
+        "last_close": last_close,
+        "predicted": float(forecast[0]),
+        "change_percent": change_percent,
+        "tier": investment_tier(change_percent),
+        "forecast": [float(price) for price in forecast],
+    }
+
+def predict(ticker, window=WINDOW):
+    return predict_many([ticker], window)[0]
+
+def last_close(ticker):
+    # Reads only the close column from the price store; no model or TensorFlow involved
+    return float(load_column(resolve(ticker)[1], "close")[-1])
@@ -0,0 +1,140 @@
+# Columnar price store
+# NSE CSV exports are parsed once into one .npy file per column (sorted by date)
+# and memory-mapped on load. A CSV newer than its store is re-ingested. Derived
+# feature columns (features.py) are computed at ingest and stored the same way.
+# Large groups of tickers are walked CHUNK_SIZE at a time with iter_chunks, so only
+# one chunk's pages need to be resident at once.
+import glob
+import os
+import sys
+import threading
+
+import numpy as np
+
+from . import metrics
+from .features import DERIVED, compute_features
+
+STORE_DIR = os.environ.get("FINVOICE_STORE_DIR", "store")
+CHUNK_SIZE = int(os.environ.get("FINVOICE_CHUNK_SIZE", 32))
+
+_locks = {}  # store directory -> ingest lock
+_locks_guard = threading.Lock()
+
+NUMERIC_COLUMNS = [
+    "open", "high", "low", "prev. close", "ltp", "close", "vwap",
+    "52w h", "52w l", "volume", "value", "no of trades",
+]
+
+
+def _column_file(column):
+    return column.replace(". ", "_").replace(" ", "_") + ".npy"
+
+
+def store_path(filename):
+    ticker = os.path.splitext(os.path.basename(filename))[0]
+    return os.path.join(STORE_DIR, ticker)
+
+
+# --- CSV Parsing ---
+def parse_csv(filename):
+    import pandas as pd
+    df = pd.read_csv(filename)
+    df.columns = df.columns.str.strip().str.lower()
+    df['date'] = pd.to_datetime(df['date'], format='%d-%b-%Y')
+    for col in NUMERIC_COLUMNS:
+        if col in df.columns:
+            # Indian-style thousands separators, e.g. "1,86,00,796"
+            df[col] = pd.to_numeric(df[col].astype(str).str.replace(',', ''), errors='coerce').astype(float)
+    return df.sort_values('date').reset_index(drop=True)
+
+
+# --- Ingest ---
+def _save(path, values):
+    # Readers may have the old file memory-mapped: write a new file and swap it in,
+    # never truncate the mapped one
+    tmp = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    with open(tmp, 'wb') as f:
+        np.save(f, values)
+    os.replace(tmp, path)
+
+
+def _ingest_lock(path):
+    # One ingest per store directory at a time within this process (e.g. the
+    # prefetch thread and the main thread asking for the same CSV)
+    with _locks_guard:
+        return _locks.setdefault(path, threading.Lock())
+
+
+def ingest(filename):
+    path = store_path(filename)
+    with _ingest_lock(path):
+        with metrics.span("csv_parse"):
+            df = parse_csv(filename)
+        os.makedirs(path, exist_ok=True)
+
+        for col in NUMERIC_COLUMNS:
+            if col in df.columns:
+                _save(os.path.join(path, _column_file(col)), df[col].to_numpy(dtype=np.float64))
+        with metrics.span("features"):
+            features = compute_features(df)
+        for name, values in features.items():
+            _save(os.path.join(path, _column_file(name)), values)
+            df[name] = values
+        # date.npy is written last and doubles as the freshness marker
+        _save(os.path.join(path, "date.npy"), df['date'].to_numpy(dtype='datetime64[D]'))
+    return df
+
+
+def is_stale(filename):
+    marker = os.path.join(store_path(filename), "date.npy")
+    if not os.path.exists(marker):
+        return True
+    return os.path.getmtime(filename) > os.path.getmtime(marker)
+
+
+# --- Load ---
+def load_column(filename, column):
+    # A single memory-mapped column, without building a DataFrame
+    if is_stale(filename):
+        metrics.count("cache", cache="price_store", result="miss")
+        ingest(filename)
+    else:
+        metrics.count("cache", cache="price_store", result="hit")
+    return np.load(os.path.join(store_path(filename), _column_file(column)), mmap_mode='r')
+
+
+def load_prices(filename):
+    import pandas as pd
+    if is_stale(filename):
+        metrics.count("cache", cache="price_store", result="miss")
+        return ingest(filename)
+    metrics.count("cache", cache="price_store", result="hit")
+
+    path = store_path(filename)
+    columns = {"date": np.load(os.path.join(path, "date.npy"), mmap_mode='r')}
+    for col in NUMERIC_COLUMNS:
+        col_path = os.path.join(path, _column_file(col))
+        if os.path.exists(col_path):
+            columns[col] = np.load(col_path, mmap_mode='r')
+    if not all(os.path.exists(os.path.join(path, _column_file(name))) for name in DERIVED):
+        # Store written before a feature was added; fill in the features only
+        for name, values in compute_features(columns).items():
+            _save(os.path.join(path, _column_file(name)), values)
+    for name in DERIVED:
+        columns[name] = np.load(os.path.join(path, _column_file(name)), mmap_mode='r')
+    return pd.DataFrame(columns, copy=False)
+
+
+def iter_chunks(filenames, chunk_size=CHUNK_SIZE):
+    # (filenames, frames) for consecutive slices of filenames; frames are loaded lazily,
+    # one chunk at a time, and dropped once the caller moves on to the next
+    for start in range(0, len(filenames), chunk_size):
+        chunk = filenames[start:start + chunk_size]
+        yield chunk, [load_prices(filename) for filename in chunk]
+
+
+if __name__ == "__main__":
+    # Usage: python -m finvoice.price_store [CSV ...]  (defaults to every CSV in the current directory)
+    for csv_file in sys.argv[1:] or sorted(glob.glob("*.csv")):
+        df = ingest(csv_file)
+        print(f"✅ {csv_file}: {len(df)} rows -> {store_path(csv_file)}")
@@ -0,0 +1,150 @@
+# Company resolver
+# Every alias in every language from the symbol table is compiled into one
+# Aho-Corasick automaton, so exact matching is a single pass over the query no
+# matter how many symbols there are. Words that don't match exactly are looked up
+# in a deletion index (SymSpell style) to catch speech-recognition misspellings
+# within a bounded edit distance, again without scanning the whole alias list.
+import re
+import unicodedata
+from collections import deque
+
+_ZERO_WIDTH = dict.fromkeys(map(ord, "\u200b\u200c\u200d\ufeff"))
+_WORD = re.compile(r"[^\s.,!?;:]+")  # \w would split Indic words at vowel signs
+MIN_FUZZY_LENGTH = 5  # Shorter aliases ("itc", "tcs") only match exactly
+TWO_EDIT_LENGTH = 10  # Aliases this long tolerate two edits; shorter ones one
+# Everyday words that sit within an edit or two of an alias ("reliable" ~ "reliance");
+# spans containing one are never looked up fuzzily
+COMMON_WORDS = frozenset("""
+    about after again also before better between buy could compare companies company falling
+    going invest investment market month months please predict price prices reliable relative
+    rising sell share shares should stock stocks their there these today tomorrow trend
+    which while would
+""".split())
+
+
+def normalize(text):
+    return unicodedata.normalize("NFC", text).translate(_ZERO_WIDTH).lower().strip()
+
+
+def max_edits(term):
+    return 0 if len(term) < MIN_FUZZY_LENGTH else 1 if len(term) < TWO_EDIT_LENGTH else 2
+
+
+def _deletes(word, k):
+    variants, frontier = {word}, {word}
+    for _ in range(k):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        variants |= frontier
+    return variants
+
+
+def edit_distance(a, b, bound):
+    # Levenshtein distance, or bound + 1 once it is known to exceed bound
+    if abs(len(a) - len(b)) > bound:
+        return bound + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > bound:
+            return bound + 1
+        previous = current
+    return previous[-1]
+
+
+class _Automaton:
+    def __init__(self, patterns):
+        # patterns: {text: payload}
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for text, payload in patterns.items():
+            node = 0
+            for ch in text:
+                if ch not in self._goto[node]:
+                    self._goto[node][ch] = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = self._goto[node][ch]
+            self._out[node].append((len(text), payload))
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def search(self, text):
+        # Yields (start, end, payload) for every occurrence of every pattern
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for length, payload in self._out[node]:
+                yield i + 1 - length, i + 1, payload
+
+
+class CompanyResolver:
+    def __init__(self, symbols):
+        # symbols: entries of the symbol table, each with "symbol", "file" and "aliases"
+        self.symbols = {entry["symbol"]: entry for entry in symbols}
+        aliases = {}
+        for entry in symbols:
+            for alias in [entry["symbol"]] + [a for names in entry["aliases"].values() for a in names]:
+                aliases.setdefault(normalize(alias), entry["symbol"])
+        self._automaton = _Automaton(aliases)
+
+        self._fuzzy = {}  # deletion variant -> {alias: symbol}
+        for alias, symbol in aliases.items():
+            if max_edits(alias) and len(alias.split()) <= 2:
+                for variant in _deletes(alias, max_edits(alias)):
+                    self._fuzzy.setdefault(variant, {})[alias] = symbol
+
+    def _exact(self, query):
+        for start, end, symbol in self._automaton.search(query):
+            # Latin aliases must sit on word boundaries ("itc" is not in "switch");
+            # Indic scripts attach suffixes to names, so those match as substrings
+            if query[start:end].isascii():
+                if (start and query[start - 1].isalnum()) or (end < len(query) and query[end].isalnum()):
+                    continue
+            yield start, end, symbol
+
+    def _closest(self, word):
+        best, best_distance = None, None
+        for variant in _deletes(word, 2):
+            for alias, symbol in self._fuzzy.get(variant, {}).items():
+                distance = edit_distance(word, alias, max_edits(alias))
+                if distance <= max_edits(alias) and (best_distance is None or distance < best_distance):
+                    best, best_distance = symbol, distance
+        return best
+
+    def match(self, query):
+        # Symbols mentioned in the query, in order of first mention
+        query = normalize(query)
+        found = {}
+        covered = set()
+        for start, end, symbol in self._exact(query):
+            found.setdefault(symbol, start)
+            covered.update(range(start, end))
+
+        words = [m for m in _WORD.finditer(query) if not covered.intersection(range(m.start(), m.end()))]
+        for n in (2, 1):
+            for i in range(len(words) - n + 1):
+                span = words[i:i + n]
+                if n == 2 and span[1].start() - span[0].end() != 1:
+                    continue
+                if any(m.group() in COMMON_WORDS for m in span):
+                    continue
+                symbol = self._closest(query[span[0].start():span[-1].end()])
+                if symbol is not None:
+                    found.setdefault(symbol, span[0].start())
+        return sorted(found, key=found.get)
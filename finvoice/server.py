@@ -0,0 +1,239 @@
+# Local HTTP prediction service
+# Keeps trained models in memory, coalesces concurrent requests for the same ticker
+# into one inference and micro-batches requests across tickers into a single
+# forecast_batch call. Standard library only; runs offline against the bundled CSVs.
+# Only symbols from the company table are served, never arbitrary CSV paths.
+#
+# Usage: python -m finvoice.server [--host 127.0.0.1] [--port 8000]
+#   GET /predict?ticker=ITC      -> {"company", "last_close", "predicted", "change_percent", "tier", "forecast"}
+#   GET /predict?ticker=ITC,TCS  -> list of the above
+#   GET /tickers, GET /health
+#   GET /metrics                 -> Prometheus text (with --metrics or FINVOICE_METRICS=prometheus)
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from . import metrics
+from .companies import list_tickers, resolve
+from .predictor import WINDOW, forecast_batch, get_model, prediction_result
+from .price_store import load_prices
+
+BATCH_WAIT = float(os.environ.get("FINVOICE_BATCH_WAIT_MS", 5)) / 1000
+MAX_BATCH = int(os.environ.get("FINVOICE_MAX_BATCH", 64))
+
+
+class PredictionService:
+    def __init__(self, window=WINDOW, batch_wait=BATCH_WAIT, max_batch=MAX_BATCH):
+        self.window = window
+        self.batch_wait = batch_wait
+        self.max_batch = max_batch
+        # TensorFlow work runs on one thread, off the event loop
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="finvoice-tf")
+        self._models = {}     # filename -> (mtime, model, scaler)
+        self._results = {}    # filename -> (mtime, result)
+        self._inflight = {}   # filename -> Future shared by every waiting request
+        self._queue = []      # (company, filename, mtime) waiting for the next batch
+        self._flush_handle = None
+
+    # --- Warm pool ---
+    def _model(self, filename, mtime):
+        entry = self._models.get(filename)
+        if entry is None or entry[0] != mtime:
+            model, scaler = get_model(filename, self.window)
+            entry = self._models[filename] = (mtime, model, scaler)
+        return entry[1], entry[2]
+
+    def warm(self, tickers):
+        for ticker in tickers:
+            filename = resolve(ticker, allow_path=False)[1]
+            self._model(filename, os.path.getmtime(filename))
+
+    # --- Coalescing ---
+    async def predict(self, ticker):
+        company, filename = resolve(ticker, allow_path=False)
+        mtime = os.path.getmtime(filename)
+        cached = self._results.get(filename)
+        if cached is not None and cached[0] == mtime:
+            metrics.count("cache", cache="result", result="hit")
+            return cached[1]
+
+        future = self._inflight.get(filename)
+        metrics.count("cache", cache="result", result="miss" if future is None else "coalesced")
+        if future is None:
+            future = self._inflight[filename] = asyncio.get_running_loop().create_future()
+            self._queue.append((company, filename, mtime))
+            self._schedule_flush()
+        return await asyncio.shield(future)
+
+    # --- Micro-batching ---
+    def _schedule_flush(self):
+        loop = asyncio.get_running_loop()
+        if len(self._queue) >= self.max_batch:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+            self._flush_handle = None
+            loop.create_task(self._flush())
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_wait, lambda: loop.create_task(self._flush()))
+
+    async def _flush(self):
+        self._flush_handle = None
+        batch, self._queue = self._queue[:self.max_batch], self._queue[self.max_batch:]
+        if self._queue:
+            self._schedule_flush()
+        if not batch:
+            return
+
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self._executor, self._run_batch, batch)
+        except Exception as e:
+            for _, filename, _ in batch:
+                self._inflight.pop(filename).set_exception(e)
+            return
+        for (_, filename, mtime), result in zip(batch, results):
+            if isinstance(result, Exception):
+                self._inflight.pop(filename).set_exception(result)
+                continue
+            self._results[filename] = (mtime, result)
+            self._inflight.pop(filename).set_result(result)
+
+    def _run_batch(self, batch):
+        metrics.count("batched_requests", len(batch))
+        with metrics.span("batch"):
+            return self._predict_batch(batch)
+
+    def _predict_batch(self, batch):
+        # One result per request, or the exception that ticker raised; a bad CSV fails
+        # only its own requests, not the rest of the batch
+        results = [None] * len(batch)
+        ready = []
+        for i, (company, filename, mtime) in enumerate(batch):
+            try:
+                df = load_prices(filename)
+                if len(df) < self.window:
+                    raise ValueError(f"{company}: {len(df)} rows, need at least {self.window}")
+                ready.append((i, company, df, *self._model(filename, mtime)))
+            except Exception as e:
+                results[i] = e
+        if ready:
+            _, _, dfs, models, scalers = zip(*ready)
+            forecasts = forecast_batch(list(models), list(scalers), list(dfs), self.window)
+            for (i, company, df, _, _), forecast in zip(ready, forecasts):
+                results[i] = prediction_result(company, df, forecast)
+        return results
+
+
+# --- HTTP ---
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               500: "Internal Server Error"}
+
+
+async def _route(service, method, target):
+    if method != "GET":
+        return 405, {"error": "only GET is supported"}
+    url = urlsplit(target)
+    if url.path == "/health":
+        return 200, {"status": "ok"}
+    if url.path == "/tickers":
+        return 200, list_tickers()
+    if url.path == "/metrics":
+        exporter = metrics.get_exporter(metrics.PrometheusExporter)
+        if exporter is None:
+            return 404, {"error": "metrics are disabled (start with --metrics)"}
+        return 200, exporter.render()
+    if url.path != "/predict":
+        return 404, {"error": f"no route for {url.path}"}
+
+    tickers = [t for value in parse_qs(url.query).get("ticker", []) for t in value.split(",") if t]
+    if not tickers:
+        return 400, {"error": "missing ?ticker="}
+    results = await asyncio.gather(*(service.predict(ticker) for ticker in tickers), return_exceptions=True)
+    for result in results:
+        if isinstance(result, KeyError):
+            return 404, {"error": result.args[0]}
+    for result in results:
+        if isinstance(result, Exception):
+            return 500, {"error": str(result)}
+    return 200, results[0] if len(results) == 1 else results
+
+
+async def _handle(service, reader, writer):
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            try:
+                method, target, version = request_line.decode("latin-1").split()
+                content_length = int(headers.get("content-length") or 0)
+            except ValueError:
+                status, payload, version = 400, {"error": "malformed request"}, "HTTP/1.0"
+            else:
+                if content_length > 0:
+                    await reader.readexactly(content_length)
+                try:
+                    status, payload = await _route(service, method, target)
+                except Exception as e:
+                    status, payload = 500, {"error": str(e)}
+
+            metrics.count("requests", status=status)
+            keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+            if isinstance(payload, str):
+                body, content_type = payload.encode(), "text/plain; version=0.0.4"
+            else:
+                body, content_type = json.dumps(payload).encode(), "application/json"
+            writer.write(
+                f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + body)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host="127.0.0.1", port=8000, warm=()):
+    service = PredictionService()
+    if warm:
+        print(f"🔥 Warming models: {', '.join(warm)}")
+        await asyncio.get_running_loop().run_in_executor(service._executor, service.warm, warm)
+    server = await asyncio.start_server(lambda r, w: _handle(service, r, w), host, port)
+    print(f"🌐 Serving predictions on http://{host}:{port}/predict?ticker=ITC")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="finvoice.server", description="Local HTTP prediction service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--warm", nargs="*", default=None,
+                        help="tickers to load before serving (default: all)")
+    parser.add_argument("--metrics", action="store_true", help="collect metrics and serve them at /metrics")
+    args = parser.parse_args(argv)
+    if args.metrics and metrics.get_exporter(metrics.PrometheusExporter) is None:
+        metrics.add_exporter(metrics.PrometheusExporter())
+    warm = list_tickers() if args.warm is None else args.warm
+    try:
+        asyncio.run(serve(args.host, args.port, warm))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+# Speech input backends
+# A backend turns a microphone or an audio/transcript file into text and reports
+# partial transcripts while the user is still speaking, so the caller can start
+# loading data and models for the companies it hears before the utterance ends.
+#
+#   google      speech_recognition + Google Web Speech (network, no partials)
+#   vosk        local Vosk model, streaming partials, fully offline
+#   transcript  a .txt file replayed word by word (tests without mic or network)
+import json
+import os
+import time
+import wave
+
+LANGUAGES = {
+    "1": ("English", "en-IN", "en"),
+    "2": ("Hindi", "hi-IN", "hi"),
+    "3": ("Telugu", "te-IN", "te"),
+    "4": ("Tamil", "ta-IN", "ta"),
+    "5": ("Kannada", "kn-IN", "kn"),
+    "6": ("Bengali", "bn-IN", "bn"),
+}
+
+SPEECH_BACKEND = os.environ.get("FINVOICE_SPEECH_BACKEND", "google")
+# Vosk model directory; "{lang}" is replaced by the language code, e.g. models/vosk-hi
+VOSK_MODEL = os.environ.get("FINVOICE_VOSK_MODEL", "vosk-model-{lang}")
+SAMPLE_RATE = 16000
+CHUNK_FRAMES = 4000
+PHRASE_TIME_LIMIT = 8
+LISTEN_TIMEOUT = 10
+PREFETCH_LIMIT = 8  # Group matches ("all banks") larger than this are not prefetched
+
+
+class SpeechError(Exception):
+    pass
+
+
+def _no_partial(text):
+    pass
+
+
+# --- Google ---
+class GoogleBackend:
+    def __init__(self, pause_threshold=1.5, calibration=1.0):
+        self.pause_threshold = pause_threshold
+        self.calibration = calibration
+
+    def transcribe(self, locale, lang, audio_path=None, on_partial=_no_partial):
+        import speech_recognition as sr
+        r = sr.Recognizer()
+        if audio_path:
+            with sr.AudioFile(audio_path) as source:
+                audio = r.record(source)
+        else:
+            with sr.Microphone() as source:
+                r.pause_threshold = self.pause_threshold
+                r.adjust_for_ambient_noise(source, duration=self.calibration)
+                audio = r.listen(source, timeout=LISTEN_TIMEOUT, phrase_time_limit=PHRASE_TIME_LIMIT)
+        try:
+            return r.recognize_google(audio, language=locale)
+        except Exception as e:
+            raise SpeechError(str(e)) from e
+
+
+# --- Vosk ---
+class VoskBackend:
+    def __init__(self, model_path=VOSK_MODEL):
+        self.model_path = model_path
+        self._models = {}
+
+    def _model(self, lang):
+        if lang not in self._models:
+            from vosk import Model
+            path = self.model_path.format(lang=lang)
+            if not os.path.isdir(path):
+                raise SpeechError(f"Vosk model not found at {path} (set FINVOICE_VOSK_MODEL)")
+            self._models[lang] = Model(path)
+        return self._models[lang]
+
+    def transcribe(self, locale, lang, audio_path=None, on_partial=_no_partial):
+        from vosk import KaldiRecognizer
+        chunks = _wav_chunks(audio_path) if audio_path else _mic_chunks()
+        rate = next(chunks)
+        recognizer = KaldiRecognizer(self._model(lang), rate)
+
+        text, last_partial = [], ""
+        for chunk in chunks:
+            if recognizer.AcceptWaveform(chunk):
+                final = json.loads(recognizer.Result()).get("text", "")
+                if final:
+                    text.append(final)
+                    if not audio_path:
+                        break  # End of the spoken phrase
+            else:
+                partial = json.loads(recognizer.PartialResult()).get("partial", "")
+                if partial and partial != last_partial:
+                    last_partial = partial
+                    on_partial(" ".join(text + [partial]))
+        text.append(json.loads(recognizer.FinalResult()).get("text", ""))
+        return " ".join(t for t in text if t)
+
+
+def _wav_chunks(path):
+    # Yields the sample rate, then raw 16-bit mono PCM chunks
+    with wave.open(path, "rb") as wav:
+        if wav.getnchannels() != 1 or wav.getsampwidth() != 2:
+            raise SpeechError(f"{path}: expected 16-bit mono PCM WAV")
+        yield wav.getframerate()
+        while True:
+            data = wav.readframes(CHUNK_FRAMES)
+            if not data:
+                return
+            yield data
+
+
+def _mic_chunks():
+    import speech_recognition as sr
+    with sr.Microphone(sample_rate=SAMPLE_RATE, chunk_size=CHUNK_FRAMES) as source:
+        yield SAMPLE_RATE
+        deadline = time.monotonic() + PHRASE_TIME_LIMIT
+        while time.monotonic() < deadline:
+            yield source.stream.read(CHUNK_FRAMES)
+
+
+# --- Transcript ---
+class TranscriptBackend:
+    # Replays a text file as if it were being spoken, one partial per word
+    def __init__(self, word_delay=0.0):
+        self.word_delay = word_delay
+
+    def transcribe(self, locale, lang, audio_path=None, on_partial=_no_partial):
+        if not audio_path:
+            raise SpeechError("the transcript backend needs a .txt input file")
+        with open(audio_path, encoding="utf-8") as f:
+            words = f.read().split()
+        for i in range(1, len(words) + 1):
+            on_partial(" ".join(words[:i]))
+            time.sleep(self.word_delay)
+        return " ".join(words)
+
+
+BACKENDS = {"google": GoogleBackend, "vosk": VoskBackend, "transcript": TranscriptBackend}
+
+
+def get_backend(name=None, audio_path=None):
+    # A .txt input always replays as a transcript; otherwise the named backend
+    if audio_path and audio_path.endswith(".txt"):
+        name = "transcript"
+    name = name or SPEECH_BACKEND
+    if name not in BACKENDS:
+        raise SpeechError(f"unknown speech backend {name!r} (choose from {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
+
+
+# --- Prefetch ---
+class Prefetcher:
+    # Watches partial transcripts and starts loading price data and models for every
+    # company mentioned so far, on a background thread, while the user keeps talking.
+    def __init__(self):
+        from concurrent.futures import ThreadPoolExecutor
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="finvoice-prefetch")
+        self._futures = {}  # csv path -> Future[(model, scaler)]
+        # TensorFlow's import is the single largest start-up cost; pay it now
+        from .backends import get_backend
+        if get_backend().uses_tensorflow:
+            self._executor.submit(__import__, "tensorflow")
+
+    def on_partial(self, text):
+        from .companies import match_company_files
+        matches = match_company_files(text)
+        if len(matches) > PREFETCH_LIMIT:
+            return
+        for _, filename in matches:
+            if filename not in self._futures:
+                self._futures[filename] = self._executor.submit(self._warm, filename)
+
+    @staticmethod
+    def _warm(filename):
+        from .predictor import get_model
+        from .price_store import load_prices
+        load_prices(filename)
+        return get_model(filename)
+
+    def entry(self, filename):
+        # (model, scaler) if this file was prefetched successfully, else None
+        future = self._futures.get(filename)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,110 @@
+# Symbol index
+# One JSON file describing every price CSV under the data directory, so start-up
+# and group queries ("all banks", "top 50") read a single small file instead of
+# opening thousands of CSVs. Layout:
+#
+#   $FINVOICE_DATA_DIR/<SYMBOL>.csv            flat, sector taken from symbols.json
+#   $FINVOICE_DATA_DIR/<Sector>/<SYMBOL>.csv   the directory name is the sector
+#
+# Each entry: symbol, file (relative to the data directory), sector, rows, first and
+# last date, average traded value over the last TURNOVER_DAYS rows, and the CSV's
+# mtime and size. A refresh only re-reads CSVs whose mtime or size changed.
+#
+# Usage: python -m finvoice.symbol_index [--rebuild]
+import argparse
+import json
+import os
+
+TURNOVER_DAYS = 20
+
+
+def index_path():
+    from .price_store import STORE_DIR
+    return os.environ.get("FINVOICE_SYMBOL_INDEX", os.path.join(STORE_DIR, "index.json"))
+
+
+def load_index(path=None):
+    # {relative csv path: entry}; empty until the first refresh
+    path = path or index_path()
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# --- Scan ---
+def scan(data_dir):
+    # Relative paths of the CSVs in data_dir and its sector subdirectories
+    for entry in os.scandir(data_dir):
+        if entry.name.startswith("."):
+            continue
+        if entry.is_file() and entry.name.lower().endswith(".csv"):
+            yield entry.name
+        elif entry.is_dir():
+            for child in os.scandir(entry.path):
+                if child.is_file() and child.name.lower().endswith(".csv"):
+                    yield os.path.join(entry.name, child.name)
+
+
+def _summarize(path):
+    # Reads the columnar store (ingesting the CSV if needed), memory-mapped
+    import numpy as np
+    from .price_store import load_column, store_path
+    load_column(path, "close")
+    dates = np.load(os.path.join(store_path(path), "date.npy"), mmap_mode='r')
+    summary = {"rows": int(len(dates)), "first_date": None, "last_date": None, "turnover": 0.0}
+    if len(dates):
+        summary["first_date"] = str(dates[0])
+        summary["last_date"] = str(dates[-1])
+        if os.path.exists(os.path.join(store_path(path), "value.npy")):
+            value = load_column(path, "value")[-TURNOVER_DAYS:]
+            summary["turnover"] = round(float(np.nanmean(value)), 2)
+    return summary
+
+
+def refresh_index(data_dir=None, symbols=None, rebuild=False, path=None):
+    # Brings the index in line with the data directory and returns it. symbols is
+    # the symbols.json table, which names the ticker and sector of known files.
+    from .companies import DATA_DIR, SYMBOLS_PATH, load_table
+    data_dir = data_dir or DATA_DIR
+    path = path or index_path()
+    known = {os.path.normpath(entry["file"]): entry for entry in (symbols or load_table(SYMBOLS_PATH))}
+    old = {} if rebuild else load_index(path)
+
+    index = {}
+    taken = set()
+    for rel in sorted(scan(data_dir)):
+        stat = os.stat(os.path.join(data_dir, rel))
+        sector_dir = os.path.dirname(rel)
+        table_entry = known.get(os.path.normpath(rel), {})
+        symbol = table_entry.get("symbol") or os.path.splitext(os.path.basename(rel))[0].upper()
+        if symbol in taken:
+            continue  # The first file found for a symbol wins
+        taken.add(symbol)
+
+        entry = old.get(rel)
+        if entry is None or entry["mtime"] != stat.st_mtime or entry["size"] != stat.st_size:
+            entry = {"mtime": stat.st_mtime, "size": stat.st_size}
+            entry.update(_summarize(os.path.join(data_dir, rel)))
+        index[rel] = dict(entry, symbol=symbol, file=rel, sector=table_entry.get("sector") or sector_dir or None)
+
+    if index != old:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=1)
+        os.replace(path + ".tmp", path)
+    return index
+
+
+# --- Main Execution ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="finvoice.symbol_index", description="Scan the data directory")
+    parser.add_argument("--rebuild", action="store_true", help="re-read every CSV, not just changed ones")
+    args = parser.parse_args(argv)
+    index = refresh_index(rebuild=args.rebuild)
+    rows = sum(entry["rows"] for entry in index.values())
+    print(f"✅ {len(index)} symbols, {rows} rows -> {index_path()}")
+
+
+if __name__ == "__main__":
+    main()
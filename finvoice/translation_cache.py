@@ -0,0 +1,141 @@
+# Translation cache for CLI output
+# Lines are translated as templates ("📈 Estimated Profit: ₹{:.2f}") and the
+# numbers are formatted in afterwards, so each fixed string is translated once per
+# language. Lookups go: static translations.py tier -> persistent LRU cache ->
+# one translator request (the misses joined by newlines) for everything still missing.
+import json
+import os
+import re
+from collections import OrderedDict
+
+from . import metrics
+from .translations import translations as STATIC_TRANSLATIONS
+
+CACHE_PATH = os.environ.get("FINVOICE_TRANSLATION_CACHE", "translation_cache.json")
+CACHE_SIZE = int(os.environ.get("FINVOICE_TRANSLATION_CACHE_SIZE", 4096))
+
+_PLACEHOLDER = re.compile(r"\{[^{}]*\}")
+
+
+def _static_index(static):
+    # (lang, English text) -> translated text, joined on the shared dictionary keys
+    english = static.get("en", {})
+    return {
+        (lang, english[key]): text
+        for lang, entries in static.items() if lang != "en"
+        for key, text in entries.items() if key in english
+    }
+
+
+class StubTranslator:
+    # Offline stand-in with googletrans' translate() shape; returns text unchanged.
+    # Its output is not a translation, so the cache never stores it.
+    persistent = False
+
+    def translate(self, text, src='en', dest='en'):
+        if isinstance(text, list):
+            return [self.translate(t, src, dest) for t in text]
+        return _Translated(text)
+
+
+class _Translated:
+    def __init__(self, text):
+        self.text = text
+
+
+class TranslationCache:
+    def __init__(self, translator, path=CACHE_PATH, max_entries=CACHE_SIZE, static=STATIC_TRANSLATIONS):
+        self.translator = translator
+        self.path = path
+        self.max_entries = max_entries
+        self._static = _static_index(static)
+        self._entries = OrderedDict()  # (lang, template) -> translation, oldest first
+        self._load()
+
+    # --- Persistence ---
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                for lang, template, text in json.load(f):
+                    self._entries[(lang, template)] = text
+        except (OSError, ValueError):
+            self._entries.clear()
+
+    def save(self):
+        if not self.path:
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump([[lang, template, text] for (lang, template), text in self._entries.items()],
+                      f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    # --- LRU ---
+    def _get(self, lang, template):
+        key = (lang, template)
+        if key in self._static:
+            return self._static[key]
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        return None
+
+    def _put(self, lang, template, text):
+        self._entries[(lang, template)] = text
+        self._entries.move_to_end((lang, template))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    # --- Translation ---
+    def _translate_lines(self, lines, src, dest):
+        # googletrans translates a list item by item, one request each; the lines go
+        # out as one newline-joined text instead and are split back afterwards
+        if len(lines) > 1 and not any("\n" in line for line in lines):
+            texts = self.translator.translate("\n".join(lines), src=src, dest=dest).text.split("\n")
+            if len(texts) == len(lines):
+                return [text.strip() for text in texts]
+        # A single line, or a reply with merged or split lines: one item per line
+        return [result.text for result in self.translator.translate(lines, src=src, dest=dest)]
+
+    def translate(self, templates, dest, src='en'):
+        # Returns one translation per template, in order. Surrounding whitespace
+        # (e.g. leading newlines) is kept out of the translated text.
+        if dest == src:
+            return list(templates)
+
+        cores = [t.strip() for t in templates]
+        found = {}
+        misses = []
+        for core in dict.fromkeys(cores):
+            text = self._get(dest, core) if core else core
+            if text is None:
+                misses.append(core)
+            else:
+                found[core] = text
+
+        metrics.count("cache", len(found), cache="translation", result="hit")
+        metrics.count("cache", len(misses), cache="translation", result="miss")
+        if misses:
+            persistent = getattr(self.translator, "persistent", True)
+            try:
+                with metrics.span("translate", lang=dest):
+                    results = self._translate_lines(misses, src, dest)
+                for core, text in zip(misses, results):
+                    # A translation that mangled the placeholders can't be formatted
+                    if sorted(_PLACEHOLDER.findall(text)) != sorted(_PLACEHOLDER.findall(core)):
+                        continue
+                    found[core] = text
+                    if persistent:
+                        self._put(dest, core, text)
+                if persistent:
+                    self.save()
+            except Exception:
+                pass
+
+        translated = []
+        for template, core in zip(templates, cores):
+            start = template.index(core) if core else 0
+            translated.append(template[:start] + found.get(core, core) + template[start + len(core):])
+        return translated
@@ -0,0 +1,142 @@
+# Localization dictionaries for different languages
+# Shared by the Streamlit app and, as a precomputed tier, by the CLI translation cache
+translations = {
+    "en": {
+        "title": "📱 Stock Predictor App",
+        "select_language": "Select Language",
+        "listening": "🎙 Listening in en... please speak now.",
+        "voice_captured": "✅ Voice captured!",
+        "company_said": "🗣 You said: `{}`",
+        "data_for": "📄 Data for: {}",
+        "last_close": "📉 Last Close: ₹{:.2f}",
+        "predicted_next": "📈 Predicted Next: ₹{:.2f}",
+        "investment_suggestion": "💡 Investment Suggestion",
+        "strong_buy": "🔼 Strong Buy (↑ {:.2f}%)",
+        "cautious_buy": "🟡 Cautious Buy (↑ {:.2f}%)",
+        "hold": "⚖️ Hold ({:.2f}%)",
+        "fall_expected": "🔻 Fall Expected (↓ {:.2f}%)",
+        "suggested_investment": "💰 Suggested Investment: ₹{}",
+        "estimated_profit": "📈 Estimated Profit: ₹{:.2f}",
+        "risk_level": "🟢 Risk Level: Low",
+        "cautious_risk_level": "🟡 Risk Level: Moderate",
+        "medium_risk_level": "🟠 Risk Level: Medium",
+        "high_risk_level": "🔴 Risk Level: High",
+        "error_company_not_found": "❌ Company not found. Try using keywords like HDFC, TCS, etc.",
+        "click_to_speak": "🎤 Click to Speak"
+    },
+    "te": {
+        "title": "📱 స్టాక్ ప్రిడిక్టర్ యాప్",
+        "select_language": "భాష ఎంచుకోండి",
+        "listening": "🎙 te లో వినిపిస్తోంది... దయచేసి ఇప్పుడు మాట్లాడండి.",
+        "voice_captured": "✅ ఆడియో క్యాప్చర్ అయింది!",
+        "company_said": "🗣 మీరు చెప్పినది: `{}`",
+        "data_for": "📄 డేటా: {}",
+        "last_close": "📉 చివరి క్లోజ్: ₹{:.2f}",
+        "predicted_next": "📈 అంచనా ప్రైవేట్: ₹{:.2f}",
+        "investment_suggestion": "💡 పెట్టుబడి సలహా",
+        "strong_buy": "🔼 బలమైన కొనుగోలు (↑ {:.2f}%)",
+        "cautious_buy": "🟡 జాగ్రత్త కొనుగోలు (↑ {:.2f}%)",
+        "hold": "⚖️ పట్టుకోండి ({:.2f}%)",
+        "fall_expected": "🔻 పడిపోతుందని అంచనా (↓ {:.2f}%)",
+        "suggested_investment": "💰 సూచించిన పెట్టుబడి: ₹{}",
+        "estimated_profit": "📈 అంచనా లాభం: ₹{:.2f}",
+        "risk_level": "🟢 ప్రమాదం స్థాయి: తక్కువ",
+        "cautious_risk_level": "🟡 ప్రమాదం స్థాయి: మధ్యస్థ",
+        "medium_risk_level": "🟠 ప్రమాదం స్థాయి: మధ్య",
+        "high_risk_level": "🔴 ప్రమాదం స్థాయి: అధిక",
+        "error_company_not_found": "❌ కంపెనీ కనుగొనబడలేదు. HDFC, TCS వంటి కీవర్డ్స్ ఉపయోగించండి.",
+        "click_to_speak": "🎤 మాట్లాడడానికి క్లిక్ చేయండి"
+    },
+    "hi": {
+        "title": "📱 स्टॉक प्रेडिक्टर ऐप",
+        "select_language": "भाषा चुनें",
+        "listening": "🎙 hi में सुन रहा हूँ... कृपया अब बोलें।",
+        "voice_captured": "✅ आवाज़ कैप्चर हो गई!",
+        "company_said": "🗣 आपने कहा: `{}`",
+        "data_for": "📄 डेटा के लिए: {}",
+        "last_close": "📉 आखिरी बंद: ₹{:.2f}",
+        "predicted_next": "📈 अगला अनुमानित: ₹{:.2f}",
+        "investment_suggestion": "💡 निवेश सुझाव",
+        "strong_buy": "🔼 मजबूत खरीदें (↑ {:.2f}%)",
+        "cautious_buy": "🟡 सतर्क खरीदें (↑ {:.2f}%)",
+        "hold": "⚖️ होल्ड करें ({:.2f}%)",
+        "fall_expected": "🔻 गिरावट की उम्मीद (↓ {:.2f}%)",
+        "suggested_investment": "💰 सुझाई गई निवेश राशि: ₹{}",
+        "estimated_profit": "📈 अनुमानित लाभ: ₹{:.2f}",
+        "risk_level": "🟢 जोखिम स्तर: कम",
+        "cautious_risk_level": "🟡 जोखिम स्तर: मध्यम",
+        "medium_risk_level": "🟠 जोखिम स्तर: उच्च",
+        "high_risk_level": "🔴 जोखिम स्तर: बहुत उच्च",
+        "error_company_not_found": "❌ कंपनी नहीं मिली। HDFC, TCS जैसे कीवर्ड्स का उपयोग करें।",
+        "click_to_speak": "🎤 बोलने के लिए क्लिक करें"
+    },
+    "ta": {
+        "title": "📱 ஸ்டாக் ப்ரிடிக்டர் ஆப்",
+        "select_language": "மொழி தேர்ந்தெடுக்கவும்",
+        "listening": "🎙 ta இல் கேட்கின்றேன்... தயவுசெய்து இப்போது பேசவும்.",
+        "voice_captured": "✅ குரல் கைப்பற்றப்பட்டது!",
+        "company_said": "🗣 நீங்கள் சொன்னது: `{}`",
+        "data_for": "📄 தரவு: {}",
+        "last_close": "📉 கடைசியில் மூடிய விலை: ₹{:.2f}",
+        "predicted_next": "📈 அடுத்த முன்னறிவு: ₹{:.2f}",
+        "investment_suggestion": "💡 முதலீட்டு பரிந்துரை",
+        "strong_buy": "🔼 வலுவான வாங்க (↑ {:.2f}%)",
+        "cautious_buy": "🟡 எச்சரிக்கையுடன் வாங்க (↑ {:.2f}%)",
+        "hold": "⚖️ பிடித்து வைக்கவும் ({:.2f}%)",
+        "fall_expected": "🔻 வீழ்ச்சி எதிர்பார்க்கப்படுகிறது (↓ {:.2f}%)",
+        "suggested_investment": "💰 பரிந்துரைக்கப்பட்ட முதலீடு: ₹{}",
+        "estimated_profit": "📈 மதிப்பிடப்பட்ட லாபம்: ₹{:.2f}",
+        "risk_level": "🟢 ஆபத்து நிலை: குறைந்தது",
+        "cautious_risk_level": "🟡 ஆபத்து நிலை: மிதமானது",
+        "medium_risk_level": "🟠 ஆபத்து நிலை: மத்திய",
+        "high_risk_level": "🔴 ஆபத்து நிலை: அதிக",
+        "error_company_not_found": "❌ நிறுவனம் கண்டுபிடிக்கவில்லை. HDFC, TCS போன்ற முக்கிய வார்த்தைகளை பயன்படுத்தவும்.",
+        "click_to_speak": "🎤 பேச கிளிக் செய்யவும்"
+    },
+    "kn": {
+        "title": "📱 ಸ್ಟಾಕ್ ಪ್ರಿಡಿಕ್ಟರ್ ಆಪ್",
+        "select_language": "ಭಾಷೆ ಆಯ್ಕೆಮಾಡಿ",
+        "listening": "🎙 kn ನಲ್ಲಿ ಕೇಳುತ್ತಿದ್ದೇನೆ... ದಯವಿಟ್ಟು ಈಗ ಮಾತನಾಡಿ.",
+        "voice_captured": "✅ ಧ್ವನಿ ಕ್ಯಾಪ್ಚರ್ ಆಗಿದೆ!",
+        "company_said": "🗣 ನೀವು ಹೇಳಿದವು: `{}`",
+        "data_for": "📄 ಡೇಟಾ: {}",
+        "last_close": "📉 ಕೊನೆಯ ಕ್ಲೋಸ್: ₹{:.2f}",
+        "predicted_next": "📈 ಮುಂದಿನ ಅನುವಾದಿತ: ₹{:.2f}",
+        "investment_suggestion": "💡 ಹೂಡಿಕೆ ಸಲಹೆ",
+        "strong_buy": "🔼 ಬಲವಾದ ಖರೀದಿ (↑ {:.2f}%)",
+        "cautious_buy": "🟡 ಎಚ್ಚರಿಕೆಯಿಂದ ಖರೀದಿ (↑ {:.2f}%)",
+        "hold": "⚖️ ಹಿಡಿದುಕೊಳ್ಳಿ ({:.2f}%)",
+        "fall_expected": "🔻 ಕೆಳಗೆ ಇಳಿಕೆಯಾಗುವುದಾಗಿ ಊಹಿಸಲಾಗಿದೆ (↓ {:.2f}%)",
+        "suggested_investment": "💰 ಸೂಚಿಸಲಾಗಿರುವ ಹೂಡಿಕೆ: ₹{}",
+        "estimated_profit": "📈 ಅಂದಾಜು ಲಾಭ: ₹{:.2f}",
+        "risk_level": "🟢 ಅಪಾಯ ಮಟ್ಟ: ಕಡಿಮೆ",
+        "cautious_risk_level": "🟡 ಅಪಾಯ ಮಟ್ಟ: ಮಧ್ಯಮ",
+        "medium_risk_level": "🟠 ಅಪಾಯ ಮಟ್ಟ: ಮಧ್ಯ",
+        "high_risk_level": "🔴 ಅಪಾಯ ಮಟ್ಟ: ಹೆಚ್ಚು",
+        "error_company_not_found": "❌ ಕಂಪನಿಯನ್ನು ಕಂಡುಹಿಡಿಯಲಿಲ್ಲ. HDFC, TCS ಎಂಬ ಕೀವರ್ಡ್‌ಗಳನ್ನು ಬಳಸಿ.",
+        "click_to_speak": "🎤 ಮಾತನಾಡಲು ಕ್ಲಿಕ್ ಮಾಡಿ"
+    },
+    "mr": {
+        "title": "📱 स्टॉक प्रेडिक्टर अ‍ॅप",
+        "select_language": "भाषा निवडा",
+        "listening": "🎙 mr मध्ये ऐकत आहे... कृपया आता बोला.",
+        "voice_captured": "✅ आवाज कॅप्चर झाला!",
+        "company_said": "🗣 तुम्ही म्हणालात: `{}`",
+        "data_for": "📄 डेटा: {}",
+        "last_close": "📉 शेवटची बंद: ₹{:.2f}",
+        "predicted_next": "📈 पुढील अन्दाज: ₹{:.2f}",
+        "investment_suggestion": "💡 गुंतवणूक सल्ला",
+        "strong_buy": "🔼 मजबूत खरेदी (↑ {:.2f}%)",
+        "cautious_buy": "🟡 काळजीपूर्वक खरेदी (↑ {:.2f}%)",
+        "hold": "⚖️ होल्ड करा ({:.2f}%)",
+        "fall_expected": "🔻 घसरण अपेक्षित आहे (↓ {:.2f}%)",
+        "suggested_investment": "💰 सुचवलेली गुंतवणूक: ₹{}",
+        "estimated_profit": "📈 अंदाजित नफा: ₹{:.2f}",
+        "risk_level": "🟢 जोखीम स्तर: कमी",
+        "cautious_risk_level": "🟡 जोखीम स्तर: मध्यम",
+        "medium_risk_level": "🟠 जोखीम स्तर: उच्च",
+        "high_risk_level": "🔴 जोखीम स्तर: अत्यधिक",
+        "error_company_not_found": "❌ कंपनी सापडली नाही. HDFC, TCS सारख्या किव्हर्ड्स वापरा.",
+        "click_to_speak": "🎤 बोलण्यासाठी क्लिक करा"
+    }
+}
@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+import unittest
+
+from finvoice.translation_cache import StubTranslator, TranslationCache, _Translated
+
+
+class EchoTranslator:
+    # Local stand-in for googletrans: tags each line with the target language and
+    # records every request
+    def __init__(self, merge_lines=False):
+        self.requests = []
+        self.merge_lines = merge_lines
+
+    def translate(self, text, src='en', dest='en'):
+        self.requests.append(text)
+        if isinstance(text, list):
+            return [_Translated(f"[{dest}] {t}") for t in text]
+        if self.merge_lines:
+            text = text.replace("\n", " ")
+        return _Translated("\n".join(f"[{dest}] {line}" for line in text.split("\n")))
+
+
+class TranslationCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "cache.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_misses_go_out_as_one_request(self):
+        translator = EchoTranslator()
+        cache = TranslationCache(translator, self.path, static={})
+        result = cache.translate(["\n📄 Loading data for: {}", "Risk Level: {}", "Hold"], "ta")
+        self.assertEqual(result, ["\n[ta] 📄 Loading data for: {}", "[ta] Risk Level: {}", "[ta] Hold"])
+        self.assertEqual(translator.requests, ["📄 Loading data for: {}\nRisk Level: {}\nHold"])
+
+    def test_cached_lines_are_not_requested_again(self):
+        translator = EchoTranslator()
+        TranslationCache(translator, self.path, static={}).translate(["Hold", "Sell"], "hi")
+        reloaded = TranslationCache(translator, self.path, static={})
+        self.assertEqual(reloaded.translate(["Sell", "Hold", "Buy"], "hi"), ["[hi] Sell", "[hi] Hold", "[hi] Buy"])
+        self.assertEqual(translator.requests[1:], [["Buy"]])
+
+    def test_merged_reply_falls_back_to_one_item_per_line(self):
+        translator = EchoTranslator(merge_lines=True)
+        cache = TranslationCache(translator, self.path, static={})
+        self.assertEqual(cache.translate(["Hold", "Sell"], "te"), ["[te] Hold", "[te] Sell"])
+        self.assertEqual(translator.requests[-1], ["Hold", "Sell"])
+
+    def test_static_tier_is_used_first(self):
+        translator = EchoTranslator()
+        static = {"en": {"hold": "Hold"}, "ta": {"hold": "காத்திருங்கள்"}}
+        cache = TranslationCache(translator, self.path, static=static)
+        self.assertEqual(cache.translate(["Hold"], "ta"), ["காத்திருங்கள்"])
+        self.assertEqual(translator.requests, [])
+
+    def test_mangled_placeholders_are_not_cached(self):
+        class Mangler(EchoTranslator):
+            def translate(self, text, src='en', dest='en'):
+                result = super().translate(text, src, dest)
+                result.text = result.text.replace("{}", "{ }")
+                return result
+        cache = TranslationCache(Mangler(), self.path, static={})
+        self.assertEqual(cache.translate(["Last close: {}"], "ta"), ["Last close: {}"])
+        self.assertFalse(os.path.exists(self.path) and json.load(open(self.path, encoding="utf-8")))
+
+    def test_stub_output_is_never_persisted(self):
+        cache = TranslationCache(StubTranslator(), self.path, static={})
+        self.assertEqual(cache.translate(["📄 Loading data for: {}"], "ta"), ["📄 Loading data for: {}"])
+        self.assertFalse(os.path.exists(self.path))
+        translator = EchoTranslator()
+        self.assertEqual(TranslationCache(translator, self.path, static={}).translate(["📄 Loading data for: {}"], "ta"),
+                         ["[ta] 📄 Loading data for: {}"])
+        self.assertEqual(len(translator.requests), 1)
+
+    def test_lru_eviction(self):
+        translator = EchoTranslator()
+        cache = TranslationCache(translator, self.path, max_entries=2, static={})
+        cache.translate(["a"], "hi")
+        cache.translate(["b"], "hi")
+        cache.translate(["a"], "hi")  # "b" is now the least recently used
+        cache.translate(["c"], "hi")
+        self.assertEqual(list(TranslationCache(translator, self.path, static={})._entries), [("hi", "a"), ("hi", "c")])
+
+
+if __name__ == "__main__":
+    unittest.main()